@@ -0,0 +1,207 @@
+# author_index.py (persistent name -> Goodreads author resolution, consulted before any author search)
+
+import argparse
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+from backlist_store import STORE_FILE
+
+# A search that found nobody is tried again after this long; found authors are kept until overridden
+DEFAULT_MISS_TTL = 30 * 24 * 3600
+
+AUTHOR_ID_PATTERN = re.compile(r'/author/show/(\d+)')
+
+Resolution = namedtuple("Resolution", "name author_id author_url matched_name confidence source resolved_at")
+
+
+def normalize_name(name):
+    """'J.R. Ward', 'JR  Ward' and 'jr ward' all share one key; accents are folded away"""
+    text = unicodedata.normalize("NFKD", str(name or "")).encode("ascii", "ignore").decode("ascii")
+    text = text.lower().replace(".", "").replace("'", "")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def author_id_from_url(url):
+    match = AUTHOR_ID_PATTERN.search(url or "")
+    return match.group(1) if match else ""
+
+
+def match_confidence(searched_name, matched_name):
+    """1.0 when the search result carries exactly the name we searched for, less the further it strays"""
+    if not matched_name:
+        return 0.0
+    return round(SequenceMatcher(None, normalize_name(searched_name), normalize_name(matched_name)).ratio(), 3)
+
+
+class AuthorIndex:
+    """
+    Maps normalized author and pen names to Goodreads author IDs. Search results are
+    recorded with a confidence score; manual entries (from the command line or the
+    roster's Goodreads Page column) always win and are never replaced by a search.
+    """
+
+    def __init__(self, path=STORE_FILE, miss_ttl=DEFAULT_MISS_TTL, refresh=False):
+        self.path = path
+        self.miss_ttl = miss_ttl
+        # refresh ignores everything searched before, but still honours manual entries
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS author_ids (
+                name_key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                author_id TEXT NOT NULL DEFAULT '',
+                author_url TEXT NOT NULL DEFAULT '',
+                matched_name TEXT NOT NULL DEFAULT '',
+                confidence REAL NOT NULL DEFAULT 0,
+                source TEXT NOT NULL,
+                resolved_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def _row(self, name):
+        row = self.conn.execute(
+            "SELECT name, author_id, author_url, matched_name, confidence, source, resolved_at "
+            "FROM author_ids WHERE name_key = ?", (normalize_name(name),)
+        ).fetchone()
+        return Resolution(*row) if row else None
+
+    def lookup(self, name):
+        """
+        The stored resolution for `name`, or None when Goodreads has to be searched.
+        A resolution with an empty author_url is a remembered "nobody found".
+        """
+        with self.lock:
+            resolution = self._row(name)
+            usable = resolution is not None and (
+                resolution.source == "manual"
+                or (not self.refresh and (resolution.author_url or time.time() - resolution.resolved_at < self.miss_ttl))
+            )
+            if usable:
+                self.hits += 1
+                return resolution
+            self.misses += 1
+            return None
+
+    def record_search(self, name, author_url, matched_name=""):
+        """Remember what a Goodreads search for `name` turned up (author_url None = nobody)"""
+        with self.lock:
+            existing = self._row(name)
+            if existing is not None and existing.source == "manual":
+                return
+            self.conn.execute(
+                "INSERT OR REPLACE INTO author_ids "
+                "(name_key, name, author_id, author_url, matched_name, confidence, source, resolved_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'search', ?)",
+                (normalize_name(name), name, author_id_from_url(author_url), author_url or "",
+                 matched_name or "", match_confidence(name, matched_name) if author_url else 0.0, time.time())
+            )
+            self.conn.commit()
+
+    def set_manual(self, name, author_url):
+        """Pin `name` to a Goodreads author page; searches will never change it"""
+        author_id = author_id_from_url(author_url)
+        if not author_id:
+            raise ValueError(f"Not a Goodreads author link: {author_url}")
+        with self.lock:
+            existing = self._row(name)
+            if existing is not None and existing.source == "manual" and existing.author_id == author_id:
+                return False
+            self.conn.execute(
+                "INSERT OR REPLACE INTO author_ids "
+                "(name_key, name, author_id, author_url, matched_name, confidence, source, resolved_at) "
+                "VALUES (?, ?, ?, ?, '', 1.0, 'manual', ?)",
+                (normalize_name(name), name, author_id, author_url, time.time())
+            )
+            self.conn.commit()
+            return True
+
+    def forget(self, name):
+        with self.lock:
+            deleted = self.conn.execute("DELETE FROM author_ids WHERE name_key = ?", (normalize_name(name),)).rowcount
+            self.conn.commit()
+            return deleted > 0
+
+    def entries(self):
+        with self.lock:
+            return [Resolution(*row) for row in self.conn.execute(
+                "SELECT name, author_id, author_url, matched_name, confidence, source, resolved_at "
+                "FROM author_ids ORDER BY name_key"
+            )]
+
+    def stats(self):
+        return f"Author index: {self.hits} names resolved without searching, {self.misses} searched"
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+_default_index = None
+_configured = False
+
+
+def configure(enabled=True, path=STORE_FILE, miss_ttl=DEFAULT_MISS_TTL, refresh=False):
+    """Set up the index every author search consults (or turn it off)"""
+    global _default_index, _configured
+    _default_index = AuthorIndex(path, miss_ttl, refresh) if enabled else None
+    _configured = True
+    return _default_index
+
+
+def default_index():
+    if not _configured:
+        configure()
+    return _default_index
+
+
+def pin_roster_links(index, rows):
+    """
+    Treat the roster's Goodreads Page column as a manual override for the author's main name.
+    rows are dicts with "Author Name" and "Goodreads Page"; returns how many entries changed.
+    """
+    pinned = 0
+    for row in rows:
+        name = str(row.get("Author Name") or "").strip()
+        link = str(row.get("Goodreads Page") or "").strip()
+        if not name or name.lower() == "nan" or not author_id_from_url(link):
+            continue
+        if not link.startswith("http"):
+            link = "https://" + link
+        if index.set_manual(name, link):
+            pinned += 1
+    return pinned
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or correct the name -> Goodreads author index")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="Show every resolved name")
+    pin = commands.add_parser("set", help="Pin a name to a Goodreads author page")
+    pin.add_argument("name")
+    pin.add_argument("url")
+    drop = commands.add_parser("forget", help="Drop a name so the next run searches for it again")
+    drop.add_argument("name")
+    args = parser.parse_args()
+
+    index = AuthorIndex()
+    if args.command == "list":
+        for entry in index.entries():
+            found = entry.author_url or "(not found)"
+            print(f"{entry.name:30} {entry.source:7} {entry.confidence:5.2f}  {found}")
+    elif args.command == "set":
+        index.set_manual(args.name, args.url)
+        print(f"📌 {args.name} -> {args.url}")
+    elif args.command == "forget":
+        print(f"🗑️  Forgot {args.name}" if index.forget(args.name) else f"{args.name} was not in the index")
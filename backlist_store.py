@@ -0,0 +1,239 @@
+# backlist_store.py (SQLite system of record for scraped backlists; xlsx is just an export)
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+
+import pandas as pd
+
+from book_normalize import normalize_books, NORMALIZED_DTYPES
+from xlsx_writers import write_dataframe
+
+try:
+    import pyarrow  # noqa: F401  (parquet engine for the columnar cache)
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+STORE_FILE = "backlist.db"
+# Workbook the store imports on first use and exports to
+LEGACY_XLSX = "author_backlists_scraped.xlsx"
+# Columnar snapshot of the books table for fast dashboard/workbook rebuilds
+PARQUET_CACHE = "backlist_cache.parquet"
+# Bump when load_books() starts producing different columns, so old snapshots are rebuilt
+SNAPSHOT_SCHEMA = 2
+
+# Spreadsheet column -> SQLite column, in the order the workbook has always used
+BOOK_COLUMNS = {
+    "Author": "author",
+    "Book Title": "book_title",
+    "Series Title": "series_title",
+    "Series Order": "series_order",
+    "Published Date": "published_date",
+    "Formats Available": "formats_available",
+    "Standalone/Series": "standalone_series",
+    "Pen Name": "pen_name",
+    "Role": "role",
+    "Date Precision": "date_precision",
+}
+
+# Low-cardinality columns are categories; everything else is plain text
+BOOK_DTYPES = {
+    name: "category" if name in ("Author", "Role", "Formats Available", "Standalone/Series", "Date Precision")
+    else "string"
+    for name in BOOK_COLUMNS
+}
+
+
+def _clean(value):
+    """Store empty cells and NaN as ''; keep everything else as text"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))  # 3.0 read back from Excel is series book 3
+    return str(value).strip()
+
+
+class BacklistStore:
+    """
+    One row per book as scraped, in scrape order. Two editions with the same title, or
+    several "Unknown Title" rows, are all kept; merging duplicates is book_dedup's job.
+    Re-scraping a name replaces its rows. scraped_names remembers every (author, searched
+    name) that finished, which is what resume checks look at - an indexed lookup instead
+    of reloading every book.
+    """
+
+    def __init__(self, path=STORE_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ",\n                ".join(
+            f"{column} TEXT NOT NULL DEFAULT ''" for column in BOOK_COLUMNS.values()
+        )
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS books (
+                id INTEGER PRIMARY KEY,
+                {columns},
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_books_author ON books(author);
+            CREATE INDEX IF NOT EXISTS idx_books_pen_name ON books(pen_name);
+            CREATE INDEX IF NOT EXISTS idx_books_series ON books(series_title);
+
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS scraped_names (
+                author TEXT NOT NULL,
+                searched_name TEXT NOT NULL,
+                book_count INTEGER NOT NULL,
+                finished_at REAL NOT NULL,
+                fingerprint TEXT NOT NULL DEFAULT '',
+                checked_at REAL,
+                PRIMARY KEY (author, searched_name)
+            );
+        """)
+        # store_id tells caches apart if backlist.db is ever deleted and rebuilt
+        self.conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('store_id', ?)", (uuid.uuid4().hex,))
+        self.conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', '0')")
+        self.conn.commit()
+
+    def _bump_revision(self):
+        self.conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'revision'")
+
+    def version(self):
+        """(store_id, revision) - changes whenever books are written"""
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        return meta["store_id"], int(meta["revision"])
+
+    def _insert(self, books):
+        if not books:
+            return
+        self._bump_revision()
+        columns = list(BOOK_COLUMNS.values())
+        now = time.time()
+        self.conn.executemany(
+            f"INSERT INTO books ({', '.join(columns)}, updated_at) "
+            f"VALUES ({', '.join('?' for _ in columns)}, ?)",
+            [[_clean(book.get(name)) for name in BOOK_COLUMNS] + [now] for book in books]
+        )
+
+    def record_name(self, author, searched_name, books, fingerprint=""):
+        """
+        Save one finished name's books and mark it done, atomically. The name's complete list
+        replaces whatever was stored for it, so books dropped from Goodreads go away on a re-scrape.
+        An empty list without a fingerprint means no list page was ever read, so books already
+        stored for the name are kept rather than replaced by nothing.
+        """
+        now = time.time()
+        pen_name = "" if searched_name == author else searched_name
+        if not books and not fingerprint and self.conn.execute(
+            "SELECT 1 FROM books WHERE author = ? AND pen_name = ? LIMIT 1", (author, pen_name)
+        ).fetchone():
+            self.mark_name_checked(author, searched_name)
+            return
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM books WHERE author = ? AND pen_name = ?", (author, pen_name)
+            ).rowcount
+            if removed and not books:
+                self._bump_revision()
+            self._insert(books)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO scraped_names "
+                "(author, searched_name, book_count, finished_at, fingerprint, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (author, searched_name, len(books), now, fingerprint, now)
+            )
+
+    def mark_name_checked(self, author, searched_name):
+        """A refresh found the name's list unchanged; its books and scrape time stay as they are"""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE scraped_names SET checked_at = ? WHERE author = ? AND searched_name = ?",
+                (time.time(), author, searched_name)
+            )
+
+    def name_status(self, author, searched_name):
+        """(finished_at, fingerprint) for a finished name, or None if it was never finished"""
+        return self.conn.execute(
+            "SELECT finished_at, fingerprint FROM scraped_names WHERE author = ? AND searched_name = ?",
+            (author, searched_name)
+        ).fetchone()
+
+    def book_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def load_books(self, author=None):
+        """
+        Books as a DataFrame with the familiar spreadsheet column names, plus the display
+        columns from book_normalize (clean title, series, order, year, series type)
+        """
+        select = ", ".join(f'{column} AS "{name}"' for name, column in BOOK_COLUMNS.items())
+        if author is None:
+            df = pd.read_sql_query(f"SELECT {select} FROM books ORDER BY id", self.conn)
+        else:
+            df = pd.read_sql_query(f"SELECT {select} FROM books WHERE author = ? ORDER BY id",
+                                   self.conn, params=(author,))
+        return normalize_books(df.astype(BOOK_DTYPES))
+
+    def load_books_cached(self, path=PARQUET_CACHE):
+        """
+        Same as load_books(), but served from a parquet snapshot while the store hasn't changed.
+        The snapshot is rewritten automatically after any write. Needs pyarrow; without it
+        this just reads SQLite.
+        """
+        if not HAVE_PYARROW:
+            return self.load_books()
+
+        store_id, revision = self.version()
+        version_path = path + ".json"
+        try:
+            with open(version_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached == {"store_id": store_id, "revision": revision, "schema": SNAPSHOT_SCHEMA} \
+                    and os.path.exists(path):
+                return pd.read_parquet(path).astype({**BOOK_DTYPES, **NORMALIZED_DTYPES})
+        except (OSError, ValueError):
+            pass
+
+        df = self.load_books()
+        df.to_parquet(path, index=False)
+        with open(version_path, "w", encoding="utf-8") as f:
+            json.dump({"store_id": store_id, "revision": revision, "schema": SNAPSHOT_SCHEMA}, f)
+        return df
+
+    def import_dataframe(self, df):
+        """Bring in an existing scraped workbook; every (author, pen name) in it counts as done"""
+        books = df.to_dict("records")
+        with self.conn:
+            self._insert(books)
+            names = {(_clean(b.get("Author")), _clean(b.get("Pen Name")) or _clean(b.get("Author"))) for b in books}
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO scraped_names (author, searched_name, book_count, finished_at) "
+                "VALUES (?, ?, 0, ?)",
+                [(author, searched, time.time()) for author, searched in names if author]
+            )
+
+    def export_xlsx(self, path=LEGACY_XLSX):
+        # Display columns are derived on load, so the workbook keeps just the stored ones
+        write_dataframe(self.load_books()[list(BOOK_COLUMNS)], path)
+
+    def close(self):
+        self.conn.close()
+
+
+def open_store(path=STORE_FILE, legacy_xlsx=LEGACY_XLSX):
+    """Open the store, importing the old scraped workbook the first time if there is one"""
+    is_new = not os.path.exists(path)
+    store = BacklistStore(path)
+    if is_new and os.path.exists(legacy_xlsx):
+        legacy = pd.read_excel(legacy_xlsx, engine="openpyxl")
+        store.import_dataframe(legacy)
+        print(f"📥 Imported {len(legacy)} books from {legacy_xlsx} into {path}")
+    return store
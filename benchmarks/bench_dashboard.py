@@ -0,0 +1,106 @@
+# benchmarks/bench_dashboard.py (streamed dashboard writer vs building the page in one string)
+#
+# Usage: python benchmarks/bench_dashboard.py [--authors 1000,5000,10000] [--books N]
+# Renders a synthetic roster of each size both ways and reports time per author and peak
+# Python memory. Streaming should stay flat per author and flat in memory as the roster grows.
+# "rebuild" is the streamed writer again with a warm card cache after one author's books changed.
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from card_cache import CardCache  # noqa: E402
+from full_pipeline import create_html_dashboard, render_dashboard_html  # noqa: E402
+
+
+def synthetic_roster(authors, books_per_author):
+    roster = []
+    books = []
+    for a in range(authors):
+        name = f"Author {a:05d}"
+        roster.append({
+            "Author Name": name,
+            "Role": "Narrator" if a % 7 == 0 else "Author",
+            "Other Names": "",
+            "Website": f"example.com/{a}",
+            "Goodreads Page": f"https://www.goodreads.com/author/show/{a}",
+            "Amazon Page": None,
+            "Audible Page": f"https://www.audible.com/author/{a}" if a % 3 == 0 else None,
+        })
+        for b in range(books_per_author):
+            books.append({
+                "Author": name,
+                "Book Title": f"Book {b} of {name} (Saga {a % 50}, #{b + 1})",
+                "Series Title": "",
+                "Series Order": "",
+                "Published Date": f"{1990 + b % 35}-03-01",
+                "Formats Available": "Kindle, Paperback",
+                "Standalone/Series": "",
+                "Pen Name": "",
+                "Role": roster[-1]["Role"],
+            })
+    return pd.DataFrame(books), roster
+
+
+def concatenated(full_data, roster, path):
+    """What the dashboard used to do: grow one string, then write it"""
+    html = ""
+    for chunk in render_dashboard_html(full_data, roster):
+        html += chunk
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+def warm_cache(full_data, roster, directory):
+    """A card cache holding every card, then one author's books edited: the writer for a small roster change"""
+    cache = CardCache(os.path.join(directory, f"cards-{len(roster)}.db"))
+    for _ in render_dashboard_html(full_data, roster, cache=cache):
+        pass
+    full_data.loc[0, "Book Title"] = "Newly announced title"
+    return lambda full_data, roster, path: create_html_dashboard(full_data, roster, path, cache=cache)
+
+
+def measure(render, full_data, roster, path):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        render(full_data, roster, path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streamed HTML dashboard writer")
+    parser.add_argument("--authors", default="1000,5000,10000",
+                        help="Comma-separated roster sizes (default: %(default)s)")
+    parser.add_argument("--books", type=int, default=8, help="Books per author (default: %(default)s)")
+    args = parser.parse_args()
+
+    print(f"{'authors':>8} {'writer':>13} {'total s':>9} {'µs/author':>10} {'peak MB':>9} {'file MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dashboard.html")
+        for authors in (int(n) for n in args.authors.split(",")):
+            full_data, roster = synthetic_roster(authors, args.books)
+            writers = [("streamed", create_html_dashboard), ("concatenated", concatenated)]
+            writers.append(("rebuild", warm_cache(full_data, roster, tmp)))
+            for label, render in writers:
+                elapsed, peak = measure(render, full_data, roster, path)
+                size = os.path.getsize(path)
+                print(f"{authors:>8} {label:>13} {elapsed:>9.2f} {elapsed / authors * 1e6:>10.1f} "
+                      f"{peak / 2**20:>9.1f} {size / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_parser.py (fast vs html.parser on saved Goodreads book list pages)
+#
+# Usage: python benchmarks/bench_parser.py [PAGES_DIR] [--repeat N]
+# PAGES_DIR defaults to the scraper's response cache, so run a scrape first
+# (or point it at a folder of saved author pages).
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import goodreads_parser  # noqa: E402
+from goodreads_parser import parse_goodreads_books  # noqa: E402
+
+
+def load_pages(directory):
+    pages = []
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            if filename.endswith(".tmp"):
+                continue
+            with open(os.path.join(root, filename), "r", encoding="utf-8", errors="replace") as f:
+                html = f.read()
+            if "schema.org/Book" in html:
+                pages.append(html)
+    return pages
+
+
+def time_backend(pages, backend, repeat):
+    # The parser prints per-book progress; keep it out of the timings
+    with contextlib.redirect_stdout(io.StringIO()):
+        records = [parse_goodreads_books(html, "Author", "Author", "Author", parser=backend) for html in pages]
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for html in pages:
+                parse_goodreads_books(html, "Author", "Author", "Author", parser=backend)
+        elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(pages)), records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare HTML parser backends on saved Goodreads pages")
+    parser.add_argument("pages_dir", nargs="?", default=".http_cache/objects")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages_dir)
+    if not pages:
+        print(f"No saved Goodreads book list pages found in {args.pages_dir}")
+        return
+    print(f"📄 {len(pages)} pages, {args.repeat} passes each (lxml installed: {goodreads_parser.HAVE_LXML})")
+
+    baseline, baseline_records = time_backend(pages, "html.parser", args.repeat)
+    fast, fast_records = time_backend(pages, "fast", args.repeat)
+
+    print(f"  html.parser: {baseline * 1000:8.2f} ms/page")
+    print(f"  fast:        {fast * 1000:8.2f} ms/page  ({baseline / fast:.1f}x)")
+    if fast_records == baseline_records:
+        print("✅ Both backends produced identical book records")
+    else:
+        mismatched = sum(1 for a, b in zip(fast_records, baseline_records) if a != b)
+        print(f"❌ {mismatched} page(s) parsed differently")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
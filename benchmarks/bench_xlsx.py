@@ -0,0 +1,84 @@
+# benchmarks/bench_xlsx.py (workbook writers: pandas to_excel vs openpyxl write-only vs xlsxwriter)
+#
+# Usage: python benchmarks/bench_xlsx.py [--rows 1000,10000,100000] [--books N]
+# Writes the scraped-data export and the styled per-author workbook from a synthetic backlist
+# of each size with every backend and reports time, time per 1k rows, peak Python memory and
+# file size. xlsxwriter rows are skipped (with a note) when it isn't installed.
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backlist_store import BOOK_COLUMNS  # noqa: E402
+from bench_dashboard import synthetic_roster  # noqa: E402
+from book_normalize import normalize_books  # noqa: E402
+from excel_backlist_builder import build_workbook  # noqa: E402
+from xlsx_writers import HAVE_XLSXWRITER, write_dataframe  # noqa: E402
+
+
+def synthetic_books(rows, books_per_author):
+    full_data, _ = synthetic_roster(-(-rows // books_per_author), books_per_author)
+    full_data = full_data.head(rows)
+    for column in BOOK_COLUMNS:
+        if column not in full_data:
+            full_data[column] = ""
+    return normalize_books(full_data)
+
+
+def writers():
+    """(workbook, backend, write(full_data, path)) for every backend available here"""
+    engines = [("openpyxl", "openpyxl")]
+    if HAVE_XLSXWRITER:
+        engines.append(("xlsxwriter", "fast"))
+    yield "export", "pandas", lambda df, path: df[list(BOOK_COLUMNS)].to_excel(path, index=False)
+    for label, engine in engines:
+        yield "export", label, lambda df, path, engine=engine: write_dataframe(df[list(BOOK_COLUMNS)], path,
+                                                                               engine=engine)
+    for label, engine in engines:
+        yield "styled", label, lambda df, path, engine=engine: build_workbook(df, path, engine)
+
+
+def measure(write, full_data, path):
+    """Time one untraced run, then take peak memory from a second run: tracing slows the writers several-fold"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        write(full_data, path)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        write(full_data, path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the xlsx workbook backends")
+    parser.add_argument("--rows", default="1000,10000,100000",
+                        help="Comma-separated book counts (default: %(default)s)")
+    parser.add_argument("--books", type=int, default=20,
+                        help="Books per author, i.e. rows per sheet of the styled workbook (default: %(default)s)")
+    args = parser.parse_args()
+
+    if not HAVE_XLSXWRITER:
+        print("(xlsxwriter is not installed; pip install xlsxwriter to compare it too)")
+    print(f"{'rows':>8} {'workbook':>9} {'backend':>11} {'total s':>9} {'ms/1k rows':>11} {'peak MB':>9} {'file MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xlsx")
+        for rows in (int(n) for n in args.rows.split(",")):
+            full_data = synthetic_books(rows, args.books)
+            for workbook, backend, write in writers():
+                elapsed, peak = measure(write, full_data, path)
+                size = os.path.getsize(path)
+                print(f"{rows:>8} {workbook:>9} {backend:>11} {elapsed:>9.2f} {elapsed / rows * 1e6:>11.1f} "
+                      f"{peak / 2**20:>9.1f} {size / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
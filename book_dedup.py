@@ -0,0 +1,137 @@
+# book_dedup.py (merges the same book found under several of an author's names)
+
+import re
+import unicodedata
+
+import pandas as pd
+
+from book_normalize import normalize_books, NORMALIZED_DTYPES
+
+# "Title (Series Name, #2)" - Goodreads appends the series to list-page titles
+TITLE_SERIES_PATTERN = re.compile(r'\s*\(([^()]*?),?\s*#\s*([\d.]+)[^()]*\)\s*$')
+TRAILING_PAREN_PATTERN = re.compile(r'\s*\([^()]*\)\s*$')
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
+# Which of the author's names each book was found under, e.g. "Jane Doe; J.D. Smith"
+FOUND_UNDER = "Found Under"
+# What goodreads_parser records for a list row without a title; such rows are never merged
+PLACEHOLDER_TITLE = "Unknown Title"
+
+
+def _text(value):
+    if value is None or pd.isna(value):
+        return ""
+    return str(value).strip()
+
+
+def _norm(value):
+    text = unicodedata.normalize("NFKD", _text(value)).encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(NON_ALNUM_PATTERN.sub(" ", text).split())
+
+
+def _norm_order(value):
+    order = _text(value).lstrip("#")
+    try:
+        return f"{float(order):g}"
+    except ValueError:
+        return _norm(order)
+
+
+def book_key(book):
+    """
+    Hash key for a book: (author, title, series, order), normalized so reissues and reprints collide.
+    None for a placeholder title, which says nothing about which book the row is.
+    """
+    title = _text(book.get("Book Title"))
+    if title == PLACEHOLDER_TITLE:
+        return None
+    series = _text(book.get("Series Title"))
+    order = _text(book.get("Series Order"))
+    match = TITLE_SERIES_PATTERN.search(title)
+    if match:
+        series = series or match.group(1)
+        order = order or match.group(2)
+    title = TRAILING_PAREN_PATTERN.sub("", title)
+    return (_norm(book.get("Author")), _norm(title), _norm(series), _norm_order(order))
+
+
+def _joined(names):
+    return ", ".join(name for name in names if name)
+
+
+class BookDedupIndex:
+    """
+    Books are added one at a time; the first copy of each key is kept and later copies only
+    fill in its blank fields and add the name they were found under. One dict lookup per
+    book, so the whole pass is O(n) and can run while records stream in.
+    """
+
+    def __init__(self):
+        self._books = {}
+        self._found_under = {}
+        self.duplicates = 0
+
+    def add(self, book):
+        """Add one book record; returns False when it merged into a book already seen"""
+        # A placeholder gets a key of its own, so it is always kept as a separate book
+        key = book_key(book) or object()
+        found_under = _text(book.get("Pen Name")) or _text(book.get("Author"))
+        kept = self._books.get(key)
+        if kept is None:
+            self._books[key] = dict(book)
+            self._found_under[key] = [found_under]
+            return True
+
+        self.duplicates += 1
+        for field, value in book.items():
+            if not _text(kept.get(field)) and _text(value):
+                kept[field] = value
+        if found_under not in self._found_under[key]:
+            self._found_under[key].append(found_under)
+        return False
+
+    def add_all(self, books):
+        for book in books:
+            self.add(book)
+        return self
+
+    def books(self):
+        """Unique books in first-seen order; Pen Name lists every pen name that produced the book"""
+        merged = []
+        for key, book in self._books.items():
+            names = self._found_under[key]
+            author = _text(book.get("Author"))
+            book = dict(book)
+            book["Pen Name"] = _joined(name for name in names if name != author)
+            book[FOUND_UNDER] = "; ".join(names)
+            merged.append(book)
+        return merged
+
+    def __len__(self):
+        return len(self._books)
+
+
+def roster_order(book):
+    """Sort key: by author, the main name's books before its pen names', each name's list in order"""
+    pen_name = _text(book.get("Pen Name"))
+    return _text(book.get("Author")), bool(pen_name), pen_name
+
+
+def dedupe_books(df):
+    """Collapse duplicate rows of a books DataFrame, keeping column order and dtypes"""
+    # Store order follows whichever name finished scraping first; sorting first means the copy
+    # that is kept, and the book order, are the same on every run
+    books = sorted(df.to_dict("records"), key=roster_order)
+    index = BookDedupIndex().add_all(books)
+    if index.duplicates:
+        print(f"🧹 Merged {index.duplicates} duplicate books found under more than one name")
+    columns = [column for column in df.columns if column != FOUND_UNDER] + [FOUND_UNDER]
+    deduped = pd.DataFrame(index.books(), columns=columns)
+    # Categories are rebuilt from the merged values rather than reusing the old category sets
+    dtypes = {column: "category" if isinstance(dtype, pd.CategoricalDtype) else dtype
+              for column, dtype in df.dtypes.items() if column != FOUND_UNDER}
+    deduped = deduped.astype({**dtypes, FOUND_UNDER: "string"})
+    if index.duplicates and set(NORMALIZED_DTYPES) <= set(deduped.columns):
+        # Merged rows may have picked up a series or date from their duplicates
+        deduped = normalize_books(deduped)
+    return deduped
@@ -0,0 +1,108 @@
+# book_normalize.py (display-ready title, series, order, year and standalone columns, computed once per load)
+
+import pandas as pd
+
+from date_extraction import ISO_PATTERN, normalize_date_value
+
+# "Book Title (Series Name, #1)" or "(Series Name, Book 1)"
+SERIES_COMMA_PATTERN = r'(?i)^(.*?)\s*\(\s*([^,]+),\s*(?:#|Book\s*)(\d+)\s*\)'
+# "Book Title (Series Name #1)" or "(Series Name Book 1)"
+SERIES_NUMBER_PATTERN = r'(?i)^(.*?)\s*\(\s*([^#]+?)(?:\s*#|Book\s*)(\d+)\s*\)'
+# "Book Title (Series Name)" - a series only if the name says so, and then it's book 1
+SERIES_NAME_PATTERN = r'(?i)^(.*?)\s*\(\s*([^)]+)\s*\)'
+SERIES_KEYWORDS = r'(?i)series|saga|chronicles|trilogy|duology'
+
+# Scraped books use the first; workbooks from other sources may use any of these
+DATE_FIELDS = [
+    "Published Date", "Release Date", "Publication Date", "Date Published",
+    "Published", "Release", "Publication", "Date", "Pub Date", "Publish Date"
+]
+
+NORMALIZED_DTYPES = {
+    "Display Title": "string",
+    "Display Series": "string",
+    "Display Order": "string",
+    "Published Year": "string",
+    "Series Type": "category",
+}
+
+
+def _cleaned(column):
+    """Stripped text with NaN/'nan'/'None' as '' (what the dashboard's clean_field used to do)"""
+    text = column.astype("string").fillna("").str.strip()
+    return text.mask(text.isin(["nan", "None"]), "")
+
+
+def _field(df, name):
+    if name in df.columns:
+        return _cleaned(df[name])
+    return pd.Series("", index=df.index, dtype="string")
+
+
+def _split_series(titles):
+    """Vectorized title parse: (clean title, series, order) columns, first matching pattern wins"""
+    clean = titles.copy()
+    series = pd.Series("", index=titles.index, dtype="string")
+    order = pd.Series("", index=titles.index, dtype="string")
+    unmatched = titles != ""
+
+    for pattern in (SERIES_COMMA_PATTERN, SERIES_NUMBER_PATTERN, SERIES_NAME_PATTERN):
+        parts = titles[unmatched].str.extract(pattern)
+        hit = parts[0].notna()
+        rows = hit[hit].index
+        clean[rows] = parts.loc[rows, 0].str.strip()
+        series[rows] = parts.loc[rows, 1].str.strip()
+        if pattern is SERIES_NAME_PATTERN:
+            order[rows] = series[rows].str.contains(SERIES_KEYWORDS).map({True: "1", False: ""})
+        else:
+            order[rows] = parts.loc[rows, 2].str.strip()
+        unmatched[rows] = False
+    return clean, series, order
+
+
+def _published_years(df):
+    """Year of the first usable date field per row; yearless text like 'Coming Soon' is kept as-is"""
+    years = pd.Series("", index=df.index, dtype="string")
+    todo = pd.Series(True, index=df.index)
+    for field in DATE_FIELDS:
+        if field not in df.columns or not todo.any():
+            continue
+        values = _cleaned(df.loc[todo, field])
+        values = values[values != ""]
+        if values.empty:
+            continue
+
+        # Almost everything in the store is already ISO: slice the year without a Python call per row
+        iso = values.str.fullmatch(ISO_PATTERN.pattern)
+        found = values[iso].str[:4]
+
+        # Anything else goes through the full parser, once per distinct value
+        other = values[~iso]
+        if not other.empty:
+            parsed = {value: normalize_date_value(value) for value in other.unique()}
+            other_years = other.map(lambda v: parsed[v][0] if parsed[v][1] == "text" else parsed[v][0][:4])
+            found = pd.concat([found, other_years[other_years != ""]])
+
+        years[found.index] = found
+        todo[found.index] = False
+    return years
+
+
+def normalize_books(df):
+    """
+    Add the display columns the dashboard and Excel builder read. Recorded Series Title and
+    Series Order win; otherwise they come from the "(Series, #n)" part of the title.
+    """
+    df = df.copy()
+    raw_titles = _field(df, "Book Title")
+    clean_titles, parsed_series, parsed_order = _split_series(raw_titles)
+    recorded_series = _field(df, "Series Title")
+    recorded_order = _field(df, "Series Order")
+
+    df["Display Title"] = clean_titles.mask(clean_titles == "", raw_titles)
+    df["Display Series"] = recorded_series.mask(recorded_series == "", parsed_series)
+    df["Display Order"] = recorded_order.mask(recorded_order == "", parsed_order)
+    df["Published Year"] = _published_years(df)
+    has_series = (df["Display Series"] != "") & (df["Display Series"].str.lower() != "nan")
+    df["Series Type"] = has_series.map({True: "Series", False: "Standalone"})
+    return df.astype(NORMALIZED_DTYPES)
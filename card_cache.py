@@ -0,0 +1,117 @@
+# card_cache.py (rendered dashboard author cards, reused while the author's roster row and books are unchanged)
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import namedtuple
+
+import pandas as pd
+
+from backlist_store import STORE_FILE
+
+# Bump whenever the card markup or the backlist-data entry changes, so old cards are not reused
+CARD_FORMAT = 1
+# Cards no build has used for this long are dropped
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+# Stands in for the card's position in the page, which the cached markup must not depend on
+CARD_NUMBER_MARK = "\x00card\x00"
+
+# html: the card's markup; entry: its backlist-data entry; words: its search words; books: book count
+Card = namedtuple("Card", "html entry words books")
+
+
+def row_hashes(full_data):
+    """One 64-bit content hash per book row, computed for the whole frame in one vectorized pass"""
+    return pd.util.hash_pandas_object(full_data, index=False).to_numpy()
+
+
+def card_key(author_row, hashes, columns, lazy):
+    """Content hash of everything a card is rendered from: roster row, book rows (in order) and table mode"""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps([CARD_FORMAT, lazy, list(columns)], default=str).encode("utf-8"))
+    digest.update(json.dumps(author_row, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(hashes.tobytes())
+    return digest.hexdigest()
+
+
+class CardCache:
+    """
+    Author cards keyed by card_key. A rebuild after a small roster edit re-renders only the
+    authors whose key changed and copies every other card out of the cache as-is.
+    """
+
+    def __init__(self, path=STORE_FILE, max_age=DEFAULT_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._used = []
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS dashboard_cards (
+                card_key TEXT PRIMARY KEY,
+                html TEXT NOT NULL,
+                entry TEXT NOT NULL,
+                words TEXT NOT NULL,
+                books INTEGER NOT NULL,
+                used_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, key):
+        row = self.conn.execute(
+            "SELECT html, entry, words, books FROM dashboard_cards WHERE card_key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used.append(key)
+        html, entry, words, books = row
+        return Card(html, json.loads(entry), words.split(), books)
+
+    def put(self, key, card):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO dashboard_cards (card_key, html, entry, words, books, used_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, card.html, json.dumps(card.entry, ensure_ascii=False, separators=(",", ":")),
+             " ".join(card.words), card.books, time.time())
+        )
+
+    def flush(self):
+        """Commit new cards, mark the reused ones as used and drop cards unused for max_age"""
+        now = time.time()
+        self.conn.executemany("UPDATE dashboard_cards SET used_at = ? WHERE card_key = ?",
+                              ((now, key) for key in self._used))
+        self._used = []
+        self.conn.execute("DELETE FROM dashboard_cards WHERE used_at < ?", (now - self.max_age,))
+        self.conn.commit()
+
+    def stats(self):
+        return f"Card cache: {self.hits} author cards reused, {self.misses} rendered"
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+_default_cache = None
+_configured = False
+
+
+def configure(enabled=True, path=STORE_FILE, max_age=DEFAULT_MAX_AGE):
+    """Set up the cache the dashboard writers use (or turn it off)"""
+    global _default_cache, _configured
+    _default_cache = CardCache(path, max_age) if enabled else None
+    _configured = True
+    return _default_cache
+
+
+def default_cache():
+    if not _configured:
+        configure()
+    return _default_cache
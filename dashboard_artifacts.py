@@ -0,0 +1,85 @@
+# dashboard_artifacts.py (minified dashboard output, precompressed .gz/.br siblings and a page-weight budget)
+
+import gzip
+import os
+import re
+
+try:
+    import brotli
+    HAVE_BROTLI = True
+except ImportError:
+    HAVE_BROTLI = False
+
+# Indentation and blank lines; newlines themselves stay so inline JS (// comments) keeps working
+LEADING_WHITESPACE_PATTERN = re.compile(r'\n[ \t]+')
+BLANK_LINES_PATTERN = re.compile(r'\n{2,}')
+
+
+class PageWeightError(Exception):
+    """A written page is heavier than the configured budget"""
+
+
+def minify_chunks(chunks):
+    """
+    Strip indentation and blank lines from a stream of HTML chunks. Whitespace left at the end
+    of a chunk is carried over so a line split across two chunks is cleaned up as one.
+    """
+    pending = ""
+    for chunk in chunks:
+        text = BLANK_LINES_PATTERN.sub("\n", LEADING_WHITESPACE_PATTERN.sub("\n", pending + chunk))
+        stripped = text.rstrip(" \t\n")
+        pending = text[len(stripped):]
+        if stripped:
+            yield stripped
+    if "\n" in pending:
+        yield "\n"
+
+
+def remove_precompressed(path, suffixes=(".gz", ".br")):
+    """Delete compressed siblings of path, so a web server can't send them in place of a newer page"""
+    for suffix in suffixes:
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def write_precompressed(path):
+    """
+    Write path.gz (and path.br when brotli is installed) next to the page; returns the sizes in bytes.
+    A .br left from a build that had brotli is removed when it can't be rewritten.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    sizes = {"raw": len(raw)}
+
+    gz = gzip.compress(raw, compresslevel=9, mtime=0)
+    with open(path + ".gz", "wb") as f:
+        f.write(gz)
+    sizes["gz"] = len(gz)
+
+    if HAVE_BROTLI:
+        br = brotli.compress(raw, quality=11)
+        with open(path + ".br", "wb") as f:
+            f.write(br)
+        sizes["br"] = len(br)
+    else:
+        remove_precompressed(path, (".br",))
+    return sizes
+
+
+def report_page_weight(pages, budget_kb=None):
+    """
+    Print raw and compressed sizes for each written page ({path: sizes}). With a budget, raise
+    PageWeightError if any page's gzipped size is over it (gzip is what every browser accepts).
+    """
+    over = []
+    for path, sizes in pages.items():
+        line = f"   📦 {path}: {sizes['raw'] / 1024:.1f} KB raw, {sizes['gz'] / 1024:.1f} KB gzip"
+        if "br" in sizes:
+            line += f", {sizes['br'] / 1024:.1f} KB brotli"
+        print(line)
+        if budget_kb is not None and sizes["gz"] > budget_kb * 1024:
+            over.append(f"{path} ({sizes['gz'] / 1024:.1f} KB gzip)")
+    if not HAVE_BROTLI:
+        print("   (install brotli to also write .br files)")
+    if over:
+        raise PageWeightError(f"Over the {budget_kb} KB page-weight budget: {', '.join(over)}")
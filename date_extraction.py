@@ -0,0 +1,134 @@
+# date_extraction.py (one-pass publication date parsing shared by the scraper and the dashboard)
+
+import datetime
+import re
+
+# Reasonable years for a bare 4-digit number; anything outside is a rating count, ISBN chunk, etc.
+# Explicit dates ("published 1813") are taken as they are
+MIN_YEAR = 1900
+MAX_YEAR = 2030
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# "published March 3, 2021" / "published March 2021" / "published 2021"
+PUBLISHED_PATTERN = re.compile(
+    r'published\s+(?:(?P<month>[A-Za-z]+)\s+(?:(?P<day>\d{1,2}),\s+)?)?(?P<year>\d{4})', re.IGNORECASE
+)
+# "March 3, 2021" anywhere in the text
+FULL_DATE_PATTERN = re.compile(r'\b(?P<month>[A-Za-z]+)\s+(?P<day>\d{1,2}),\s+(?P<year>\d{4})\b')
+# A bare 4-digit year
+YEAR_PATTERN = re.compile(r'\b(\d{4})\b')
+# Already-normalized values: "2021", "2021-03", "2021-03-03" (optionally followed by a time)
+ISO_PATTERN = re.compile(r'^(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?(?:[ T].*)?$')
+
+
+def to_iso(year, month=None, day=None):
+    """
+    Build the normalized (iso_date, precision) pair.
+    Precision is "day", "month" or "year"; a bad month/day degrades to the coarser precision.
+    """
+    year = int(year)
+    if isinstance(month, str):
+        month = int(month) if month.isdigit() else MONTHS.get(month[:3].lower())
+    if month:
+        if day:
+            try:
+                return datetime.date(year, int(month), int(day)).isoformat(), "day"
+            except ValueError:
+                pass
+        if 1 <= int(month) <= 12:
+            return f"{year:04d}-{int(month):02d}", "month"
+    return f"{year:04d}", "year"
+
+
+def _from_match(match):
+    return to_iso(match.group("year"), match.group("month"), match.group("day"))
+
+
+def _bare_year(text):
+    """The first 4-digit number in text as a year, if it is a plausible publication year"""
+    match = YEAR_PATTERN.search(text)
+    if match and MIN_YEAR <= int(match.group(1)) <= MAX_YEAR:
+        return to_iso(match.group(1))
+    return "", ""
+
+
+def extract_published_date(texts, debug=False):
+    """
+    Find the publication date in the .greyText snippets of one Goodreads book row.
+    Texts mentioning "published" win; otherwise the first full date or plausible year is used.
+    Returns (iso_date, precision), or ("", "") when nothing looks like a date.
+    """
+    for i, text in enumerate(texts):
+        lowered = text.lower()
+        if debug:
+            print(f"  Checking date element {i+1}: '{text[:100]}...'")
+
+        has_published = 'published' in lowered
+        # Skip if this is clearly ONLY a rating element or ONLY editions
+        if not has_published and ('rate this book' in lowered or lowered.strip().endswith('editions')):
+            if debug:
+                print("    Skipping non-date element")
+            continue
+
+        if has_published:
+            match = PUBLISHED_PATTERN.search(text)
+            if match:
+                result = _from_match(match)
+                if result[0]:
+                    if debug:
+                        print(f"  ✅ Found {result[1]} (published pattern): {result[0]}")
+                    return result
+            continue
+
+        match = FULL_DATE_PATTERN.search(text)
+        if match:
+            result = _from_match(match)
+            if result[0]:
+                if debug:
+                    print(f"  ✅ Found {result[1]}: {result[0]}")
+                return result
+
+        # Only trust a bare year when it isn't sitting next to rating counts
+        if 'avg rating' not in lowered:
+            result = _bare_year(text)
+            if result[0]:
+                if debug:
+                    print(f"  ✅ Found year: {result[0]}")
+                return result
+    return "", ""
+
+
+def normalize_date_value(value):
+    """
+    Normalize a date read back from a spreadsheet cell: ISO strings, "Month Day, Year" text,
+    float years like 2019.0, or datetime objects. Text with no year at all (e.g. "Coming Soon")
+    comes back unchanged with precision "text". Unusable values give ("", "").
+    """
+    if value is None:
+        return "", ""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return to_iso(value.year, value.month, value.day)
+    if isinstance(value, (int, float)):
+        if value != value:  # NaN
+            return "", ""
+        try:
+            return to_iso(int(value))
+        except (ValueError, OverflowError):
+            return "", ""
+
+    text = str(value).strip()
+    if not text or text.lower() in ("nan", "none", "nat"):
+        return "", ""
+    match = ISO_PATTERN.match(text)
+    if match:
+        return to_iso(*match.groups())
+    match = PUBLISHED_PATTERN.search(text) or FULL_DATE_PATTERN.search(text)
+    if match:
+        return _from_match(match)
+    if YEAR_PATTERN.search(text):
+        return _bare_year(text)
+    return text, "text"
@@ -1,33 +1,23 @@
 # excel_backlist_builder.py
 
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+import argparse
 import re
-
-# Load scraped data
-scraped_data = pd.read_excel("author_backlists_scraped.xlsx", engine='openpyxl')
-
-# Initialize workbook
-wb = Workbook()
-default_sheet = wb.active
-wb.remove(default_sheet)
-
-# Create Dashboard sheet
-dashboard = wb.create_sheet("Dashboard")
-dashboard.append(["Author Name", "Link to Tab"])
-
-# Define styles
-hot_pink_fill = PatternFill(start_color="EC008C", end_color="EC008C", fill_type="solid")
-black_font_bold = Font(color="000000", bold=True)
-gray_fill = PatternFill(start_color="F7F7F7", end_color="F7F7F7", fill_type="solid")
-thin_border = Border(
-    left=Side(style='thin', color='000000'),
-    right=Side(style='thin', color='000000'),
-    top=Side(style='thin', color='000000'),
-    bottom=Side(style='thin', color='000000')
-)
+from backlist_store import open_store
+from book_dedup import dedupe_books
+from xlsx_writers import open_workbook, add_engine_argument
+
+OUTPUT_FILE = "author_backlist_final.xlsx"
+
+# Define styles; registered once per workbook and referred to by name from every cell
+STYLES = {
+    "header": {"bold": True, "color": "000000", "fill": "EC008C", "border": True, "align": "center"},
+    "connect": {"bold": True, "color": "000000", "fill": "EC008C", "border": True, "align": "left"},
+    "boxed": {"border": True},
+    "boxed date": {"border": True, "number_format": "MM/DD/YYYY"},
+    "shaded": {"fill": "F7F7F7", "border": True},
+    "shaded date": {"fill": "F7F7F7", "border": True, "number_format": "MM/DD/YYYY"},
+    "footer": {"italic": True, "align": "center"},
+}
 
 # Define headers
 headers = [
@@ -36,84 +26,107 @@ headers = [
     "Narrators", "Kindle Unlimited (Y/N)", "Kobo+ (Y/N)",
     "Genre", "Standalone/Series", "Other Notes"
 ]
-
-# Process each unique author
-authors = scraped_data["Author"].dropna().unique()
-for author in authors:
-    author_data = scraped_data[scraped_data["Author"] == author]
-    tab_name = re.sub(r'[\\/*?:"<>|]', '', author)  # Clean tab name
-    tab_name = author if len(author) <= 31 else author[:28] + "..."
-    ws = wb.create_sheet(tab_name)
+# Title, series, order and series type come pre-normalized from the store
+book_columns = ["Display Title", "Display Series", "Display Order", "Published Date",
+                "Formats Available", "Series Type"]
+DATE_COLUMN = headers.index("Published Date")
+
+# Characters Excel doesn't allow in a sheet name, and its length limit
+INVALID_TAB_CHARS = re.compile(r'[\\/*?:\[\]]')
+MAX_TAB_LENGTH = 31
+
+
+def unique_tab_name(author, taken):
+    """
+    A valid sheet name for the author, not already in taken (lower-cased, as Excel compares
+    them case-insensitively). Names cut to the same 31 characters get " (2)", " (3)", ...
+    """
+    name = INVALID_TAB_CHARS.sub('', author).strip().strip("'") or "Author"
+    if len(name) > MAX_TAB_LENGTH:
+        name = name[:MAX_TAB_LENGTH - 3] + "..."
+    tab_name = name
+    number = 2
+    while tab_name.lower() in taken:
+        suffix = f" ({number})"
+        tab_name = name[:MAX_TAB_LENGTH - len(suffix)] + suffix
+        number += 1
+    taken.add(tab_name.lower())
+    return tab_name
+
+
+def write_author_sheet(wb, author, tab_name, books):
+    """books: the author's (title, series, order, published, formats, series type) tuples, in order"""
+    ws = wb.add_sheet(tab_name)
 
     # Connect with Author block
-    ws.merge_cells('A1:B1')
-    ws['A1'] = f"Connect with {author}"
-    ws['A1'].alignment = Alignment(horizontal='left')
-    ws['A1'].font = black_font_bold
-    ws['A1'].fill = hot_pink_fill
-    for row in range(1, 5):
-        ws[f'A{row}'].border = thin_border
-        ws[f'B{row}'].border = thin_border
-    ws['A2'] = "🌐 Website"
-    ws['B2'] = ""
-    ws['A3'] = "📚 Goodreads"
-    ws['B3'] = ""
-    ws['A4'] = "🛒 Amazon"
-    ws['B4'] = ""
+    ws.append([f"Connect with {author}", None], ["connect", "boxed"], span=2)
+    ws.append(["🌐 Website", ""], "boxed")
+    ws.append(["📚 Goodreads", ""], "boxed")
+    ws.append(["🛒 Amazon", ""], "boxed")
 
     # Spacer row
     ws.append([])
     ws.append([])
-    ws.append(headers)
-
-    # Format header
-    for col_num, column_title in enumerate(headers, 1):
-        cell = ws[f'{get_column_letter(col_num)}7']
-        cell.font = black_font_bold
-        cell.fill = hot_pink_fill
-        cell.alignment = Alignment(horizontal='center')
-        cell.border = thin_border
-
-    # Add book rows
-    for idx, row_data in enumerate(author_data.itertuples(index=False), start=8):
+    ws.append(headers, "header")
+
+    # Add book rows, shading every other one
+    plain = ["boxed"] * len(headers)
+    plain[DATE_COLUMN] = "boxed date"
+    shaded = ["shaded"] * len(headers)
+    shaded[DATE_COLUMN] = "shaded date"
+    for idx, row_data in enumerate(books, start=8):
+        title, series, order, published, formats, series_type = row_data
         row_list = [
-            row_data._1, row_data._2, row_data._3, row_data._4,
-            row_data._5, "", "", "", "", "", "", "", "", ""
+            title, series, order, published,
+            formats, "", "", "", "", "", "", "", series_type, ""
         ]
-        ws.append(row_list)
-        for col_num in range(1, len(headers)+1):
-            cell = ws[f'{get_column_letter(col_num)}{idx}']
-            if idx % 2 == 1:
-                cell.fill = gray_fill
-            cell.border = thin_border
-            if col_num == 4:
-                cell.number_format = 'MM/DD/YYYY'
-
-    # Add to dashboard
-    if [author, f"='{tab_name}'!A1"] not in dashboard:
-        dashboard.append([author, f"='{tab_name}'!A1"])
-
-# Style dashboard header
-for col in range(1, 3):
-    cell = dashboard.cell(row=1, column=col)
-    cell.fill = hot_pink_fill
-    cell.font = black_font_bold
-    cell.alignment = Alignment(horizontal='center')
-    cell.border = thin_border
-
-# Border entire dashboard table
-for row_idx in range(1, dashboard.max_row + 1):
-    for col_idx in range(1, 3):
-        dashboard.cell(row=row_idx, column=col_idx).border = thin_border
-
-# Footer
-footer_row = dashboard.max_row + 3
-footer_text = "Compiled for Charm City Romanticon 2026 by Plot Twists & Pivot Tables"
-dashboard.merge_cells(start_row=footer_row, start_column=1, end_row=footer_row, end_column=2)
-dashboard.cell(row=footer_row, column=1).value = footer_text
-dashboard.cell(row=footer_row, column=1).alignment = Alignment(horizontal='center')
-dashboard.cell(row=footer_row, column=1).font = Font(italic=True)
-
-# Save file
-wb.save("author_backlist_final.xlsx")
-print("Excel file created: author_backlist_final.xlsx")
+        ws.append(row_list, shaded if idx % 2 == 1 else plain)
+
+
+def build_workbook(scraped_data, path=OUTPUT_FILE, engine=None):
+    """
+    Stream the workbook to path. Rows are written once, in order, and flushed to disk as they
+    go, so memory stays flat however many books there are. engine: see xlsx_writers.
+    """
+    wb = open_workbook(path, STYLES, engine)
+
+    # Create Dashboard sheet
+    dashboard = wb.add_sheet("Dashboard")
+    dashboard.append(["Author Name", "Link to Tab"], "header")
+    linked = set()
+    taken_tabs = {"dashboard"}
+
+    # Process each unique author; one grouping pass finds every author's rows
+    rows_by_author = scraped_data.groupby("Author", sort=False, observed=True).indices
+    book_rows = list(scraped_data[book_columns].itertuples(index=False, name=None))
+    authors = scraped_data["Author"].dropna().unique()
+    for author in authors:
+        if author in linked:
+            continue
+        linked.add(author)
+        tab_name = unique_tab_name(author, taken_tabs)
+        write_author_sheet(wb, author, tab_name, (book_rows[i] for i in rows_by_author[author]))
+
+        # Add to dashboard; quotes in the sheet name are doubled inside the reference
+        link = [author, "='{}'!A1".format(tab_name.replace("'", "''"))]
+        dashboard.append(link, "boxed")
+
+    # Footer
+    footer_text = "Compiled for Charm City Romanticon 2026 by Plot Twists & Pivot Tables"
+    dashboard.append([])
+    dashboard.append([])
+    dashboard.append([footer_text], "footer", span=2)
+
+    # Save file
+    wb.close()
+    print(f"Excel file created: {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the styled per-author backlist workbook")
+    add_engine_argument(parser)
+    args = parser.parse_args()
+
+    # Load scraped data, with books found under several pen names merged into one row
+    scraped_data = dedupe_books(open_store().load_books_cached())
+    build_workbook(scraped_data, engine=args.xlsx_engine)
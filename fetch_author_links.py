@@ -11,10 +11,8 @@ import urllib.parse
 from urllib.parse import unquote, urlparse, parse_qs
 import concurrent.futures as cf
 import validators
+import http_session
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
-}
 CACHE_FILE = "link_cache.json"
 
 # Load existing cache
@@ -34,7 +32,7 @@ cse_id = "a630b28b577ad4870"
 def search_google(query, api_key, cse_id):
     url = f"https://www.googleapis.com/customsearch/v1?key={api_key}&cx={cse_id}&q={query}"
     try:
-        resp = requests.get(url)
+        resp = http_session.get(url)
         data = resp.json()
         return [item["link"] for item in data["items"]]
     except requests.exceptions.RequestException as e:
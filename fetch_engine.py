@@ -0,0 +1,92 @@
+# fetch_engine.py (asyncio fetcher with per-host token-bucket rate limiting)
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import http_session
+
+# Politeness budget: each host gets RATE requests per second on average,
+# with up to BURST requests allowed back-to-back before throttling kicks in.
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 2
+# How many requests may be waiting on the network at once (across all hosts)
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+class TokenBucket:
+    """Classic token bucket: refills `rate` tokens per second, holds at most `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then take it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncFetcher:
+    """
+    Keeps many GET requests in flight while every host stays inside its token bucket.
+    Must be created inside a running event loop (e.g. from a coroutine started by asyncio.run).
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                 max_in_flight=DEFAULT_MAX_IN_FLIGHT, cache=None):
+        self.rate = rate
+        self.burst = burst
+        self.cache = cache
+        self.buckets = {}
+        self.in_flight = asyncio.Semaphore(max_in_flight)
+        self.executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        http_session.set_pool_size(max_in_flight)
+
+    def bucket_for(self, url):
+        host = urlparse(url).netloc.lower()
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    async def fetch(self, url, revalidate=False):
+        """
+        Fetch a URL and return the response body as text (raises on HTTP errors).
+        revalidate=True skips the cache's TTL and asks the server (a 304 still reuses the cached body).
+        """
+        loop = asyncio.get_running_loop()
+        if self.cache is not None and not revalidate:
+            # Fresh cache hits never touch the network, so they don't spend the host's budget
+            body = await loop.run_in_executor(self.executor, self.cache.get_fresh, url)
+            if body is not None:
+                return body
+
+        # Slot first, then token: a token is only spent when the request can go out right away,
+        # so the host's bucket (not the semaphore queue) decides when requests are sent
+        async with self.in_flight:
+            await self.bucket_for(url).acquire()
+            if self.cache is not None:
+                return await loop.run_in_executor(self.executor, self.cache.revalidate, url)
+            response = await loop.run_in_executor(self.executor, http_session.get, url)
+        response.raise_for_status()
+        return response.text
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
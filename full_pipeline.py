@@ -1,106 +1,205 @@
 # full_pipeline.py (HTML Dashboard Version - No More Excel Drama!)
 
 import os
-from scrape_goodreads_backlist import search_goodreads_author, scrape_goodreads_books
+import json
+import re
+import unicodedata
+import time
+import argparse
+import contextlib
+import glob
+import sys
+from scrape_goodreads_backlist import (
+    scrape_names, add_fetch_arguments, apply_fetch_arguments, fetch_options, print_cache_stats, positive_int
+)
 import pandas as pd
 from openpyxl import load_workbook
-import time
-import re
 from html import escape
+from book_normalize import normalize_books, NORMALIZED_DTYPES
+from backlist_store import open_store, LEGACY_XLSX, BOOK_COLUMNS
+import author_index
+from book_dedup import dedupe_books
+import card_cache
+from card_cache import Card, CARD_NUMBER_MARK, card_key, row_hashes
+from xlsx_writers import write_dataframe
+from dashboard_artifacts import (minify_chunks, write_precompressed, remove_precompressed, report_page_weight,
+                                 PageWeightError)
+
+# With --refresh, names scraped longer ago than this are re-crawled even if their list looks unchanged
+DEFAULT_STALE_DAYS = 30
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Scrape Goodreads backlists and build the HTML dashboard")
+    add_fetch_arguments(parser)
+    parser.add_argument("--skip-scrape", action="store_true",
+                        help="Don't contact Goodreads; rebuild the dashboard from the stored backlist")
+    parser.add_argument("--tables", choices=["lazy", "eager"], default="lazy",
+                        help="'lazy' embeds the books as JSON and builds each table when it is first opened; "
+                             "'eager' writes every table into the page (default: %(default)s)")
+    parser.add_argument("--pages", choices=["single", "letter", "fixed"], default="single",
+                        help="'letter' writes one page per initial, 'fixed' pages of --authors-per-page authors, "
+                             "each linked from an index page with search across all of them (default: %(default)s)")
+    parser.add_argument("--authors-per-page", type=positive_int, default=250,
+                        help="Authors per page with --pages fixed (default: %(default)s)")
+    parser.add_argument("--page-budget-kb", type=float, default=1024,
+                        help="Pages bigger than this are split further (default: %(default)s)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-check already scraped names and re-scrape only those whose Goodreads list changed")
+    parser.add_argument("--stale-days", type=float, default=DEFAULT_STALE_DAYS,
+                        help="With --refresh, fully re-scrape names last scraped longer ago than this "
+                             "(default: %(default)s)")
+    parser.add_argument("--minify", action="store_true",
+                        help="Strip indentation and blank lines from the written pages")
+    parser.add_argument("--precompress", action="store_true",
+                        help="Also write .gz (and .br, if brotli is installed) copies of every page for the web server")
+    parser.add_argument("--weight-budget-kb", type=float, default=None,
+                        help="Fail if any page's gzipped size is over this; implies --precompress")
+    parser.add_argument("--no-card-cache", action="store_true",
+                        help="Render every author card again instead of reusing unchanged ones")
+    return parser
 
 # ----------------------- SCRAPE PHASE -----------------------
-print("[1/2] Scraping Goodreads backlists...")
-
-# Load authors from your real convention xlsx
-wb = load_workbook("announced_authors.xlsx")
-ws = wb.active
-
-data = []
-for row in ws.iter_rows(min_row=2, values_only=True):
-    author = row[0]
-    role = row[1]
-    other_names = row[2]
-    website_link = row[3]
-    goodreads_link = row[4]
-    amazon_link = row[5]
-    audible_link = row[6]
-    
-    data.append({
-        "Author Name": author,
-        "Role": role,
-        "Other Names": other_names,
-        "Website": website_link,
-        "Goodreads Page": goodreads_link,
-        "Amazon Page": amazon_link,
-        "Audible Page": audible_link
-    })
-
-author_df = pd.DataFrame(data)
-
-# Load existing scraped data if it exists
-if os.path.exists("author_backlists_scraped.xlsx"):
-    existing_data = pd.read_excel("author_backlists_scraped.xlsx", engine="openpyxl")
-    scraped_authors = existing_data["Author"].dropna().unique().tolist()
-    print(f"Found existing scraped data. {len(scraped_authors)} authors already scraped.")
-else:
-    existing_data = pd.DataFrame()
-    scraped_authors = []
-
-# Determine which entries still need to be scraped
-entries_to_scrape = [entry for entry in data if entry["Author Name"] not in scraped_authors]
-print(f"Entries to scrape: {[e['Author Name'] for e in entries_to_scrape]}")
-
-new_books = []
-for idx, row in author_df.iterrows():
-    name = str(row.get("Author Name", "")).strip()
-    if not name or name.lower() == "nan":
-        print(f"⚠️  Skipping row {idx} — missing Author Name")
-        continue
-
-    if name in scraped_authors:
-        continue  # already scraped
-
-    role = str(row.get("Role", "")).strip() or "Author"
-    other_names_raw = row.get("Other Names")
-    if pd.isna(other_names_raw):
-        other_names_raw = ""
-    pen_names = [n.strip() for n in str(other_names_raw).split(",") if n.strip()]
-
-    names_to_scrape = [name] + pen_names
-
-    # Get the author data for later use
-    author_row = None
-    for entry in data:
-        if entry["Author Name"] == name:
-            author_row = entry
-            break
-
-    for pen_name in names_to_scrape:
-        print(f"🔍 Scraping {pen_name} for {name} ({role})...")
-        author_url = search_goodreads_author(pen_name)
-        if author_url:
-            books = scrape_goodreads_books(author_url, name, role, pen_name)
-            for book in books:
-                book["Author"] = name
-                book["Pen Name"] = pen_name if pen_name != name else ""
-                book["Role"] = role
-            new_books.extend(books)
-        time.sleep(2)
-    print(f"✅ Finished scraping {name}")
-
-# Merge new data with existing data
-if new_books:
-    new_data = pd.DataFrame(new_books)
-    full_data = pd.concat([existing_data, new_data], ignore_index=True)
-else:
-    full_data = existing_data
-
-# Save updated data
-full_data.to_excel("author_backlists_scraped.xlsx", index=False)
-print("Scraping complete. Data saved to author_backlists_scraped.xlsx\n")
+def load_roster():
+    """Load authors from your real convention xlsx"""
+    wb = load_workbook("announced_authors.xlsx")
+    ws = wb.active
+
+    data = []
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        author = row[0]
+        role = row[1]
+        other_names = row[2]
+        website_link = row[3]
+        goodreads_link = row[4]
+        amazon_link = row[5]
+        audible_link = row[6]
+
+        data.append({
+            "Author Name": author,
+            "Role": role,
+            "Other Names": other_names,
+            "Website": website_link,
+            "Goodreads Page": goodreads_link,
+            "Amazon Page": amazon_link,
+            "Audible Page": audible_link
+        })
+    return data
+
+def scrape_phase(args, data):
+    author_df = pd.DataFrame(data)
+
+    # Scraped books live in the SQLite store; each finished name is committed as it completes,
+    # so an interrupted run resumes exactly where it stopped
+    store = open_store()
+    print(f"Found existing scraped data. {store.book_count()} books already in {store.path}.")
+
+    # Goodreads links already in the roster resolve those authors without a search request
+    pinned = author_index.pin_roster_links(author_index.default_index(), data)
+    if pinned:
+        print(f"📌 Using {pinned} Goodreads links from the roster")
+
+    new_book_count = 0
+    unchanged_count = 0
+    entries_to_scrape = []
+    jobs = []
+    # (author, searched name) -> list fingerprint, for finished names a refresh only has to re-check
+    fingerprints = {}
+    stale_before = time.time() - args.stale_days * 24 * 3600
+    for idx, row in author_df.iterrows():
+        name = str(row.get("Author Name", "")).strip()
+        if not name or name.lower() == "nan":
+            print(f"⚠️  Skipping row {idx} — missing Author Name")
+            continue
+
+        role = str(row.get("Role", "")).strip() or "Author"
+        other_names_raw = row.get("Other Names")
+        if pd.isna(other_names_raw):
+            other_names_raw = ""
+        pen_names = [n.strip() for n in str(other_names_raw).split(",") if n.strip()]
+
+        names_to_scrape = []
+        for searched_name in [name] + pen_names:
+            status = store.name_status(name, searched_name)
+            if status is None:
+                names_to_scrape.append(searched_name)
+            elif args.refresh:
+                finished_at, fingerprint = status
+                if finished_at >= stale_before:
+                    fingerprints[(name, searched_name)] = fingerprint
+                names_to_scrape.append(searched_name)
+        if not names_to_scrape:
+            continue  # already scraped
+        entries_to_scrape.append(name)
+
+        for pen_name in names_to_scrape:
+            print(f"🔍 Queued {pen_name} for {name} ({role})...")
+            jobs.append((pen_name, name, role, pen_name))
+
+    print(f"Entries to scrape: {entries_to_scrape}")
+
+    def record_finished_name(job, books, complete, fingerprint):
+        nonlocal new_book_count, unchanged_count
+        pen_name, name, role, _ = job
+        if books is None:
+            # Refresh found the same list as last time - nothing to parse or write
+            store.mark_name_checked(name, pen_name)
+            unchanged_count += 1
+            return
+        if not complete:
+            # A partial list is never written: the name stays unfinished and the next run retries it
+            print(f"⚠️  Scrape of {pen_name} for {name} was incomplete; it will be retried next run")
+            return
+        for book in books:
+            book["Author"] = name
+            book["Pen Name"] = pen_name if pen_name != name else ""
+            book["Role"] = role
+        new_book_count += len(books)
+        # Committed before we move on, so a crash from here on never loses this name
+        store.record_name(name, pen_name, books, fingerprint)
+        print(f"✅ Finished scraping {pen_name} for {name}")
+
+    if args.skip_scrape:
+        print(f"⏭️  --skip-scrape: leaving {len(jobs)} queued names for a later run")
+    else:
+        # All names are fetched concurrently; the per-host token bucket keeps us polite to Goodreads
+        scrape_names(jobs, **fetch_options(args), fingerprints=fingerprints, on_result=record_finished_name)
+        if args.refresh:
+            print(f"🔄 Refresh: {unchanged_count} names unchanged, {len(jobs) - unchanged_count} re-scraped")
+        print_cache_stats()
+
+    # Served from the parquet snapshot when nothing was scraped since the last build
+    full_data = store.load_books_cached()
+
+    # The workbook is only an export now; refresh it when something changed
+    if new_book_count or not os.path.exists(LEGACY_XLSX):
+        write_dataframe(full_data[list(BOOK_COLUMNS)], LEGACY_XLSX)
+        print(f"Scraping complete. {len(full_data)} books in {store.path}, exported to {LEGACY_XLSX}\n")
+    else:
+        print(f"Scraping complete. {len(full_data)} books in {store.path}\n")
+
+    # Co-written titles and reissues show up under several pen names; the dashboard lists each once
+    full_data = dedupe_books(full_data)
+    return full_data
 
 # ----------------------- HTML DASHBOARD PHASE -----------------------
-print("[2/2] Building HTML dashboard...")
+DASHBOARD_FILE = "charm_city_romanticon_2026_backlists.html"
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+@contextlib.contextmanager
+def atomic_write(path):
+    """
+    Write to path.tmp and move it over path only once the whole file is written, so a failure
+    part-way through (bad row, Ctrl-C, full disk) leaves the previous good file in place
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as f:
+            yield f
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
 
 def clean_url(url):
     """Clean and validate URL"""
@@ -113,59 +212,59 @@ def clean_url(url):
     else:
         return "https://" + url
 
-def create_html_dashboard():
+def index_roster(data):
+    """Author Name -> roster record (the first one, if a name is listed twice)"""
+    roster_by_name = {}
+    for entry in data:
+        roster_by_name.setdefault(entry["Author Name"], entry)
+    return roster_by_name
+
+def index_books_by_author(full_data):
+    """Lower-cased author name -> positions of that author's rows, built in one grouping pass"""
+    author_keys = full_data["Author"].astype("string").str.lower()
+    return full_data.groupby(author_keys, sort=False).indices
+
+SEARCH_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+def search_tokens(text):
+    """Lower-cased, accent-folded words; the page tokenizes queries the same way"""
+    folded = "".join(c for c in unicodedata.normalize("NFKD", str(text)) if not unicodedata.combining(c))
+    return SEARCH_TOKEN_PATTERN.findall(folded.lower())
+
+def card_search_words(*texts):
+    """Every distinct word in texts, in first-seen order"""
+    words = {}
+    for text in texts:
+        if text is None or pd.isna(text):
+            continue
+        words.update(dict.fromkeys(search_tokens(text)))
+    return list(words)
+
+def add_search_terms(search_index, card, words):
+    """Record that every word in words should find author card number `card`"""
+    for word in words:
+        postings = search_index.setdefault(word, [])
+        if not postings or postings[-1] != card:
+            postings.append(card)
+
+def render_dashboard_html(full_data, data, totals=None, lazy=True, page_nav="", cache=None):
+    """
+    Generate the dashboard page as a stream of HTML chunks, one author card at a time,
+    so nothing has to hold the whole page. totals (a dict), if given, receives the author
+    and book counts, the card names and the page's word index once the last chunk has
+    been produced. page_nav is extra HTML shown under the header (links between pages).
+    With lazy=True the book tables are not written out: the books go into one compact JSON
+    block at the end of the page and an author's table is built the first time it is opened.
+    cache, a CardCache, lets unchanged authors' cards be reused instead of rendered again.
+    """
     # All helper functions consolidated here
-    def clean_field(field_value):
+    def clean_text(field_value):
         if pd.isna(field_value) or str(field_value).strip() in ['', 'nan', 'None']:
             return ""
-        return escape(str(field_value).strip())
-    
-    def parse_series_from_title(title_text):
-        """
-        Parse series info from book title patterns like:
-        - "Book Title (Series Name, #1)"
-        - "Book Title (Series Name #1)" 
-        - "Book Title (Series Name Book 1)"
-        Returns: (clean_title, series_name, series_order)
-        """
-        if not title_text or pd.isna(title_text):
-            return "", "", ""
-        
-        title = str(title_text).strip()
-        
-        # Pattern 1: (Series Name, #1) or (Series Name, Book 1)
-        pattern1 = r'^(.*?)\s*\(\s*([^,]+),\s*(?:#|Book\s*)(\d+)\s*\)'
-        match1 = re.match(pattern1, title, re.IGNORECASE)
-        if match1:
-            clean_title = match1.group(1).strip()
-            series_name = match1.group(2).strip()
-            series_order = match1.group(3).strip()
-            return clean_title, series_name, series_order
-        
-        # Pattern 2: (Series Name #1) or (Series Name Book 1)
-        pattern2 = r'^(.*?)\s*\(\s*([^#]+?)(?:\s*#|Book\s*)(\d+)\s*\)'
-        match2 = re.match(pattern2, title, re.IGNORECASE)
-        if match2:
-            clean_title = match2.group(1).strip()
-            series_name = match2.group(2).strip()
-            series_order = match2.group(3).strip()
-            return clean_title, series_name, series_order
-        
-        # Pattern 3: (Series Name) - assume book 1 or standalone
-        pattern3 = r'^(.*?)\s*\(\s*([^)]+)\s*\)'
-        match3 = re.match(pattern3, title, re.IGNORECASE)
-        if match3:
-            clean_title = match3.group(1).strip()
-            series_name = match3.group(2).strip()
-            # Only treat as series if it contains certain keywords
-            if any(keyword in series_name.lower() for keyword in ['series', 'saga', 'chronicles', 'trilogy', 'duology']):
-                return clean_title, series_name, "1"
-            else:
-                # Might be series name, but we're not sure of order
-                return clean_title, series_name, ""
-        
-        # No series info found in title, return as standalone
-        return title, "", ""
+        return str(field_value).strip()
+
+    def clean_field(field_value):
+        return escape(clean_text(field_value))
     
     def format_yes_no_maybe(field_value):
         clean_val = clean_field(field_value).lower()
@@ -174,19 +273,12 @@ def create_html_dashboard():
         elif clean_val in ['no', 'n', 'false', '0']:
             return '<span class="yes-no-cell no-cell">No</span>'
         elif clean_val in ['maybe', 'm', '?', 'possible']:
-            return '<span class="yes-no-cell" style="color: #ffc107; font-weight: bold;">Maybe</span>'
+            return '<span class="yes-no-cell maybe-cell">Maybe</span>'
         elif clean_val:
             return f'<span class="yes-no-cell">{escape(str(field_value))}</span>'
         else:
             return '<span class="yes-no-cell">-</span>'
     
-    def determine_standalone_series(series_title, series_order):
-        """Determine if book is standalone or part of series"""
-        if series_title and series_title.strip() and series_title.lower() != "nan":
-            return "Series"
-        else:
-            return "Standalone"
-    
     def determine_audiobook_status(author_name, role, author_data):
         """Determine audiobook availability based on role and Audible presence"""
         # All narrators get "Yes"
@@ -202,7 +294,137 @@ def create_html_dashboard():
         # No Audible link = "No"
         return "No"
 
-    html_content = """<!DOCTYPE html>
+    def author_entry(person, role, author_row, books):
+        """The card's backlist-data entry"""
+        # Audio status depends only on the author, so it is sent once rather than per book
+        rows = []
+        for book in books:
+            pen_name = clean_text(book.get("Pen Name", ""))
+            if pen_name.lower() == person.lower():
+                pen_name = ""
+            rows.append([
+                clean_text(book.get("Display Title", "")),
+                clean_text(book.get("Series Type", "")),
+                clean_text(book.get("Display Series", "")),
+                clean_text(book.get("Display Order", "")),
+                clean_text(book.get("Published Year", "")),
+                clean_text(book.get("Formats Available", "")),
+                pen_name,
+            ])
+        return [person, role, determine_audiobook_status(person, role, author_row), rows]
+
+    def author_card(person, role, author_row, books, card_number):
+        """The card markup, chunk by chunk"""
+        # Clean person name for JavaScript
+        clean_person = escape(person).replace("'", "\\'")
+        
+        yield f"""
+            <div class="author-card" data-name="{escape(person.lower())}" data-role="{escape(role.lower())}">
+                <div class="author-name">{escape(person)}</div>
+                <div class="author-role">{escape(role)}</div>
+                <div class="links">
+        """
+        
+        # Add links only if they exist
+        links_added = 0
+        if clean_url(author_row.get("Website")):
+            yield f'<a href="{clean_url(author_row.get("Website"))}" class="link-btn" target="_blank"><span>🌐</span>Website</a>'
+            links_added += 1
+        
+        if clean_url(author_row.get("Goodreads Page")):
+            yield f'<a href="{clean_url(author_row.get("Goodreads Page"))}" class="link-btn" target="_blank"><span>📚</span>Goodreads</a>'
+            links_added += 1
+        
+        if clean_url(author_row.get("Amazon Page")):
+            yield f'<a href="{clean_url(author_row.get("Amazon Page"))}" class="link-btn" target="_blank"><span>🛒</span>Amazon</a>'
+            links_added += 1
+        
+        if clean_url(author_row.get("Audible Page")):
+            yield f'<a href="{clean_url(author_row.get("Audible Page"))}" class="link-btn" target="_blank"><span>🎧</span>Audible</a>'
+            links_added += 1
+        
+        if links_added == 0:
+            yield '<div class="links-empty">Links coming soon!</div>'
+        
+        yield '</div>'
+        
+        # Add books section
+        if books and lazy:
+            yield f"""
+                <div class="books-section">
+                    <div class="books-toggle" onclick="toggleBooks('{clean_person}')">
+                        📖 View Books ({len(books)})
+                    </div>
+                    <div id="books-{clean_person}" class="books-list" data-books="{card_number}"></div>
+                </div>
+            """
+        elif books:
+            yield f"""
+                <div class="books-section">
+                    <div class="books-toggle" onclick="toggleBooks('{clean_person}')">
+                        📖 View Books ({len(books)})
+                    </div>
+                    <div id="books-{clean_person}" class="books-list">
+                        <div class="table-container">
+                            <table class="books-table">
+                                <thead>
+                                    <tr>
+                                        <th>Book Title</th>
+                                        <th>Standalone/Series</th>
+                                        <th>Series</th>
+                                        <th>Order</th>
+                                        <th>Published Year</th>
+                                        <th>Formats</th>
+                                        <th>Audio</th>
+                                        <th>Pen Name</th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+            """
+            
+            for book in books:
+                # Title, series, order, year and standalone/series were normalized when the data was loaded
+                title = clean_field(book.get("Display Title", ""))
+                series = clean_field(book.get("Display Series", ""))
+                series_order = clean_field(book.get("Display Order", ""))
+                published_date = clean_field(book.get("Published Year", ""))
+                standalone_series = clean_field(book.get("Series Type", ""))
+                formats = clean_field(book.get("Formats Available", ""))
+                
+                # Determine audiobook status based on role and Audible presence
+                audiobook_status = determine_audiobook_status(person, role, author_row)
+                audiobook = format_yes_no_maybe(audiobook_status)
+                
+                pen_name = clean_field(book.get("Pen Name", ""))
+                
+                # Only show pen name if different from main author name
+                if pen_name.lower() == person.lower():
+                    pen_name = ""
+                
+                yield f"""
+                    <tr>
+                        <td class="book-title-cell">{title or "-"}</td>
+                        <td>{standalone_series}</td>
+                        <td class="series-cell">{series or "-"}</td>
+                        <td>{series_order or "-"}</td>
+                        <td>{published_date or "-"}</td>
+                        <td>{formats or "-"}</td>
+                        <td>{audiobook}</td>
+                        <td>{pen_name or "-"}</td>
+                    </tr>
+                """
+            
+            yield """
+                                </tbody>
+                            </table>
+                        </div>
+                    </div>
+                </div>
+            """
+        
+        yield "</div>"
+
+    yield """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -499,6 +721,31 @@ def create_html_dashboard():
             color: #dc3545;
         }
         
+        .maybe-cell {
+            color: #ffc107;
+        }
+        
+        .links-empty {
+            text-align: center;
+            color: #999;
+            font-style: italic;
+        }
+        
+        .disclaimer-message {
+            background: linear-gradient(45deg, #ff6b6b, #ff8e8e);
+            padding: 25px;
+            margin: 25px;
+            border-radius: 12px;
+            border-left: 6px solid #dc3545;
+            font-style: italic;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            color: white;
+        }
+        
+        .stats.page-nav {
+            background: #fff0f8;
+        }
+        
         .link-cell a {
             color: #EC008C;
             text-decoration: none;
@@ -570,7 +817,9 @@ def create_html_dashboard():
             <h1>📚 Charm City Romanticon 2026</h1>
             <p>Author & Narrator Backlists</p>
         </div>
-        
+        """
+    yield page_nav
+    yield """
         <div class="support-message">
             <strong>💡 Support Authors Directly</strong><br>
             Whenever possible, consider purchasing books directly from the author's website if they have a store.
@@ -579,13 +828,13 @@ def create_html_dashboard():
             But every direct purchase makes a bigger impact. 💖
         </div>
         
-        <div class="disclaimer-message" style="background: linear-gradient(45deg, #ff6b6b, #ff8e8e); padding: 25px; margin: 25px; border-radius: 12px; border-left: 6px solid #dc3545; font-style: italic; box-shadow: 0 2px 10px rgba(0,0,0,0.1); color: white;">
+        <div class="disclaimer-message">
             <strong>⚠️ Amazon Scraping Disclaimer</strong><br>
             My goal was to scrape all this data online and deliver a more comprehensive dashboard with detailed buy links, library availability, narrator info, and more. Unfortunately, Amazon is a massive pain in the ass and doesn't allow you to effectively scrape their data. So a big F*** YOU to Amazon! 🖕 Therefore, I had to condense the columns I would have liked to include. I'm sorry for the limitations, but blame Amazon's anti-scraping fortress, not me! 😤
         </div>
         
         <div class="search-bar">
-            <input type="text" class="search-input" placeholder="Search authors..." onkeyup="searchAuthors()">
+            <input type="text" class="search-input" placeholder="Search authors, pen names, books, series..." oninput="scheduleSearch()">
             <button class="export-btn" onclick="exportToCSV()">
                 📊 Export to Excel/Sheets
             </button>
@@ -601,213 +850,195 @@ def create_html_dashboard():
     # Track stats
     total_authors = 0
     total_books = 0
+    # word -> author card numbers, over names, roles, pen names, titles and series
+    search_index = {}
+    # One entry per author card, in card order:
+    # [name, role, audio status, [[title, standalone/series, series, order, year, formats, pen name], ...]]
+    # The CSV export always reads it; in lazy mode the book tables are built from it too
+    payload = []
     
+    # Data straight from the store is already normalized; anything else is normalized here once
+    if not set(NORMALIZED_DTYPES) <= set(full_data.columns):
+        full_data = normalize_books(full_data)
+
+    # One pass to index roster entries and books, instead of scanning both for every author
+    roster_by_name = index_roster(data)
+    books_by_author = index_books_by_author(full_data)
+
     # Add each author
-    for person in sorted(full_data["Author"].dropna().unique()):
-        person_data = full_data[full_data["Author"].str.lower() == person.lower()]
-        role = person_data["Role"].iloc[0] if "Role" in person_data else "Author"
-        
-        # Find author info
-        author_row = None
-        for entry in data:
-            if entry["Author Name"] == person:
-                author_row = entry
-                break
-        
-        if not author_row:
-            continue
-        
-        total_authors += 1
-        books = person_data.to_dict('records')
-        total_books += len(books)
-        
-        # Clean person name for JavaScript
-        clean_person = escape(person).replace("'", "\\'")
-        
-        html_content += f"""
-            <div class="author-card" data-name="{escape(person.lower())}" data-role="{escape(role.lower())}">
-                <div class="author-name">{escape(person)}</div>
-                <div class="author-role">{escape(role)}</div>
-                <div class="links">
-        """
-        
-        # Add links only if they exist
-        links_added = 0
-        if clean_url(author_row.get("Website")):
-            html_content += f'<a href="{clean_url(author_row.get("Website"))}" class="link-btn" target="_blank"><span>🌐</span>Website</a>'
-            links_added += 1
-        
-        if clean_url(author_row.get("Goodreads Page")):
-            html_content += f'<a href="{clean_url(author_row.get("Goodreads Page"))}" class="link-btn" target="_blank"><span>📚</span>Goodreads</a>'
-            links_added += 1
-        
-        if clean_url(author_row.get("Amazon Page")):
-            html_content += f'<a href="{clean_url(author_row.get("Amazon Page"))}" class="link-btn" target="_blank"><span>🛒</span>Amazon</a>'
-            links_added += 1
-        
-        if clean_url(author_row.get("Audible Page")):
-            html_content += f'<a href="{clean_url(author_row.get("Audible Page"))}" class="link-btn" target="_blank"><span>🎧</span>Audible</a>'
-            links_added += 1
-        
-        if links_added == 0:
-            html_content += '<div style="text-align: center; color: #999; font-style: italic;">Links coming soon!</div>'
-        
-        html_content += '</div>'
-        
-        # Add books section
-        if books:
-            html_content += f"""
-                <div class="books-section">
-                    <div class="books-toggle" onclick="toggleBooks('{clean_person}')">
-                        📖 View Books ({len(books)})
-                    </div>
-                    <div id="books-{clean_person}" class="books-list">
-                        <div class="table-container">
-                            <table class="books-table">
-                                <thead>
-                                    <tr>
-                                        <th>Book Title</th>
-                                        <th>Standalone/Series</th>
-                                        <th>Series</th>
-                                        <th>Order</th>
-                                        <th>Published Year</th>
-                                        <th>Formats</th>
-                                        <th>Audio</th>
-                                        <th>Pen Name</th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-            """
-            
-            for book in books:
-                # Parse book title for series info
-                raw_title = book.get("Book Title", "")
-                clean_title, parsed_series, parsed_order = parse_series_from_title(raw_title)
-                
-                # Use parsed data or fall back to existing data
-                title = escape(clean_title) if clean_title else clean_field(raw_title)
-                
-                # For series, prefer existing data, then parsed data
-                existing_series = clean_field(book.get("Series Title", ""))
-                series = existing_series if existing_series else parsed_series
-                
-                # For order, prefer existing data, then parsed data  
-                existing_order = clean_field(book.get("Series Order", ""))
-                series_order = existing_order if existing_order else parsed_order
-                
-                # Try multiple date field names and clean up the format
-                published_date = ""
-                possible_date_fields = [
-                    "Published Date", "Release Date", "Publication Date", "Date Published",
-                    "Published", "Release", "Publication", "Date", "Pub Date", "Publish Date"
-                ]
-                
-                for date_field in possible_date_fields:
-                    if book.get(date_field):
-                        raw_date_value = book.get(date_field)
-                        
-                        # Skip if the value is NaN or None
-                        if pd.isna(raw_date_value) or raw_date_value is None:
-                            continue
-                        
-                        # Handle float years (like 2019.0) and convert to clean integers
-                        if isinstance(raw_date_value, (int, float)):
-                            # Additional check for NaN floats
-                            if pd.isna(raw_date_value):
-                                continue
-                                
-                            # If it's a number, assume it's a year
-                            try:
-                                year = int(raw_date_value)
-                                if 1900 <= year <= 2030:  # Reasonable year range
-                                    published_date = str(year)
-                                    break
-                            except (ValueError, OverflowError):
-                                continue
-                        else:
-                            # If it's a string, clean it
-                            date_value = clean_field(raw_date_value)
-                            if date_value:
-                                # Try to extract just the year from string dates
-                                year_match = re.search(r'\b(\d{4})\b', date_value)
-                                if year_match:
-                                    try:
-                                        year = int(year_match.group(1))
-                                        if 1900 <= year <= 2030:
-                                            published_date = str(year)
-                                            break
-                                    except ValueError:
-                                        continue
-                                else:
-                                    # If no year found, use the original string
-                                    published_date = date_value
-                                    break
-                
-                # Other fields
-                formats = clean_field(book.get("Formats Available", ""))
-                
-                # Determine standalone vs series properly
-                standalone_series = determine_standalone_series(series, series_order)
-                
-                # Determine audiobook status based on role and Audible presence
-                audiobook_status = determine_audiobook_status(person, role, author_row)
-                audiobook = format_yes_no_maybe(audiobook_status)
-                
-                pen_name = clean_field(book.get("Pen Name", ""))
-                
-                # Only show pen name if different from main author name
-                if pen_name.lower() == person.lower():
-                    pen_name = ""
-                
-                html_content += f"""
-                    <tr>
-                        <td class="book-title-cell">{title or "-"}</td>
-                        <td>{standalone_series}</td>
-                        <td class="series-cell">{series or "-"}</td>
-                        <td>{series_order or "-"}</td>
-                        <td>{published_date or "-"}</td>
-                        <td>{formats or "-"}</td>
-                        <td>{audiobook}</td>
-                        <td>{pen_name or "-"}</td>
-                    </tr>
-                """
-            
-            html_content += """
-                                </tbody>
-                            </table>
-                        </div>
-                    </div>
-                </div>
-            """
-        
-        html_content += "</div>"
+    columns = list(full_data.columns)
+    hashes = row_hashes(full_data) if cache is not None else None
+    # Cards cached so far are saved even if the caller stops reading part-way through the page
+    try:
+        for person in sorted(full_data["Author"].dropna().unique()):
+            positions = books_by_author[person.lower()]
+            role = full_data["Role"].iloc[positions[0]] if "Role" in full_data else "Author"
+        
+            # Find author info
+            author_row = roster_by_name.get(person)
+        
+            if not author_row:
+                continue
+        
+            total_authors += 1
+            card_number = total_authors - 1
+
+            # An unchanged author's card comes straight from the cache, skipping the books entirely
+            key = card_key(author_row, hashes[positions], columns, lazy) if cache is not None else None
+            card = cache.get(key) if cache is not None else None
+            if card is None:
+                books = full_data.iloc[positions].to_dict('records')
+                words = card_search_words(person, role, author_row.get("Other Names"),
+                                          *(book.get(field) for book in books
+                                            for field in ("Display Title", "Display Series", "Pen Name")))
+                card = Card(None, author_entry(person, role, author_row, books), words, len(books))
+                if cache is None:
+                    yield from author_card(person, role, author_row, books, card_number)
+                else:
+                    card = card._replace(html="".join(author_card(person, role, author_row, books, CARD_NUMBER_MARK)))
+                    cache.put(key, card)
+            if card.html is not None:
+                yield card.html.replace(CARD_NUMBER_MARK, str(card_number), 1)
+
+            add_search_terms(search_index, card_number, card.words)
+            payload.append(card.entry)
+            total_books += card.books
+    finally:
+        if cache is not None:
+            cache.flush()
     
-    html_content += f"""
+    yield """
         </div>
         
         <div class="footer">
             Compiled for Charm City Romanticon 2026 by Plot Twists & Pivot Tables
         </div>
     </div>
-    
+    """
+
+    # One author per chunk; "<" is escaped so a title can never end the script element
+    yield '\n    <script type="application/json" id="backlist-data">['
+    for i, entry in enumerate(payload):
+        chunk = json.dumps(entry, ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
+        yield ("," if i else "") + chunk
+    yield "]</script>\n"
+
+    # Sorted words with their posting lists, so the page finds every word with a given prefix by binary search
+    words = sorted(search_index)
+    search_json = json.dumps({"words": words, "cards": [search_index[word] for word in words]},
+                             ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
+    yield f'\n    <script type="application/json" id="search-index">{search_json}</script>\n'
+
+    yield f"""
     <script>
         // Update stats
         document.getElementById('stats').innerHTML = `📊 {total_authors} Authors & Narrators • {total_books} Books`;
         
+        let backlistData = null;
+        const audioCells = {json.dumps({status: format_yes_no_maybe(status) for status in ("Yes", "Maybe", "No")})};
+        
+        function loadBacklist() {{
+            if (!backlistData) {{
+                backlistData = JSON.parse(document.getElementById('backlist-data').textContent);
+            }}
+            return backlistData;
+        }}
+        
+        function escapeHtml(text) {{
+            return String(text).replace(/[&<>"']/g, c => ({{
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+            }})[c]);
+        }}
+        
+        // Lazy dashboards ship their books as JSON; build an author's table the first time it's needed
+        function renderBooks(booksList) {{
+            if (booksList.dataset.books === undefined || booksList.dataset.rendered) {{
+                return;
+            }}
+            const [, , audioStatus, books] = loadBacklist()[booksList.dataset.books];
+            const audio = audioCells[audioStatus];
+            const rows = books.map(([title, standaloneSeries, series, order, year, formats, penName]) => `
+                    <tr>
+                        <td class="book-title-cell">${{escapeHtml(title || '-')}}</td>
+                        <td>${{escapeHtml(standaloneSeries)}}</td>
+                        <td class="series-cell">${{escapeHtml(series || '-')}}</td>
+                        <td>${{escapeHtml(order || '-')}}</td>
+                        <td>${{escapeHtml(year || '-')}}</td>
+                        <td>${{escapeHtml(formats || '-')}}</td>
+                        <td>${{audio}}</td>
+                        <td>${{escapeHtml(penName || '-')}}</td>
+                    </tr>`).join('');
+            booksList.innerHTML = `
+                <div class="table-container">
+                    <table class="books-table">
+                        <thead>
+                            <tr>
+                                <th>Book Title</th>
+                                <th>Standalone/Series</th>
+                                <th>Series</th>
+                                <th>Order</th>
+                                <th>Published Year</th>
+                                <th>Formats</th>
+                                <th>Audio</th>
+                                <th>Pen Name</th>
+                            </tr>
+                        </thead>
+                        <tbody>${{rows}}</tbody>
+                    </table>
+                </div>`;
+            booksList.dataset.rendered = 'true';
+        }}
+        
         function toggleBooks(author) {{
             const booksList = document.getElementById('books-' + author);
+            renderBooks(booksList);
             booksList.classList.toggle('show');
         }}
         
+        let searchIndex = null;
+        let searchTimer = null;
+        
+        function searchWords(text) {{
+            return text.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase().match(/[\\p{{L}}\\p{{N}}]+/gu) || [];
+        }}
+        
+        // Card numbers for every indexed word starting with prefix (binary search over the sorted words)
+        function cardsForPrefix(prefix) {{
+            const words = searchIndex.words;
+            let lo = 0, hi = words.length;
+            while (lo < hi) {{
+                const mid = (lo + hi) >> 1;
+                if (words[mid] < prefix) lo = mid + 1; else hi = mid;
+            }}
+            const found = new Set();
+            for (let i = lo; i < words.length && words[i].startsWith(prefix); i++) {{
+                searchIndex.cards[i].forEach(card => found.add(card));
+            }}
+            return found;
+        }}
+        
+        function scheduleSearch() {{
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(searchAuthors, 120);
+        }}
+        
         function searchAuthors() {{
-            const searchTerm = document.querySelector('.search-input').value.toLowerCase();
+            const searchTerm = document.querySelector('.search-input').value.trim();
             const cards = document.querySelectorAll('.author-card');
-            let visibleCount = 0;
+            if (!searchIndex) {{
+                searchIndex = JSON.parse(document.getElementById('search-index').textContent);
+            }}
+            
+            // Every word typed must start some word on the card (author, pen name, role, title or series)
+            let matches = null;
+            for (const word of searchWords(searchTerm)) {{
+                const found = cardsForPrefix(word);
+                matches = matches === null ? found : new Set([...matches].filter(card => found.has(card)));
+            }}
             
-            cards.forEach(card => {{
-                const name = card.dataset.name;
-                const role = card.dataset.role;
-                const isVisible = name.includes(searchTerm) || role.includes(searchTerm);
+            let visibleCount = 0;
+            cards.forEach((card, i) => {{
+                const isVisible = matches === null || matches.has(i);
                 
                 if (isVisible) {{
                     card.classList.remove('hidden');
@@ -819,7 +1050,7 @@ def create_html_dashboard():
             
             // Update stats
             if (searchTerm) {{
-                document.getElementById('stats').innerHTML = `🔍 Showing ${{visibleCount}} results for "${{searchTerm}}"`;
+                document.getElementById('stats').innerHTML = `🔍 Showing ${{visibleCount}} results for "${{escapeHtml(searchTerm)}}"`;
             }} else {{
                 document.getElementById('stats').innerHTML = `📊 {total_authors} Authors & Narrators • {total_books} Books`;
             }}
@@ -842,41 +1073,27 @@ def create_html_dashboard():
                 'Pen Name'
             ]);
             
-            // Get all author cards
-            const authorCards = document.querySelectorAll('.author-card');
-            
-            authorCards.forEach(card => {{
-                const authorName = card.querySelector('.author-name').textContent;
-                const authorRole = card.querySelector('.author-role').textContent;
-                
-                // Get the books table for this author
-                const booksTable = card.querySelector('.books-table tbody');
-                
-                if (booksTable) {{
-                    const rows = booksTable.querySelectorAll('tr');
-                    
-                    rows.forEach(row => {{
-                        const cells = row.querySelectorAll('td');
-                        if (cells.length > 0) {{
-                            const rowData = [
-                                authorName,
-                                authorRole,
-                                cells[0]?.textContent?.trim() || '', // Book Title
-                                cells[1]?.textContent?.trim() || '', // Standalone/Series
-                                cells[2]?.textContent?.trim() || '', // Series
-                                cells[3]?.textContent?.trim() || '', // Order
-                                cells[4]?.textContent?.trim() || '', // Published Year
-                                cells[5]?.textContent?.trim() || '', // Formats
-                                cells[6]?.textContent?.trim() || '', // Audio
-                                cells[7]?.textContent?.trim() || ''  // Pen Name
-                            ];
-                            csvData.push(rowData);
-                        }}
-                    }});
-                }} else {{
+            // Built straight from the embedded data, so it costs the same whether or not tables were opened
+            loadBacklist().forEach(([authorName, authorRole, audioStatus, books]) => {{
+                if (books.length === 0) {{
                     // If no books, add just the author info
                     csvData.push([authorName, authorRole, '', '', '', '', '', '', '', '']);
+                    return;
                 }}
+                books.forEach(([title, standaloneSeries, series, order, year, formats, penName]) => {{
+                    csvData.push([
+                        authorName,
+                        authorRole,
+                        title || '-',
+                        standaloneSeries,
+                        series || '-',
+                        order || '-',
+                        year || '-',
+                        formats || '-',
+                        audioStatus,
+                        penName || '-'
+                    ]);
+                }});
             }});
             
             // Convert to CSV format
@@ -916,6 +1133,13 @@ def create_html_dashboard():
             }}
         }}
         
+        // Pages opened from the index's search arrive with ?q=... already filled in
+        const initialQuery = new URLSearchParams(window.location.search).get('q');
+        if (initialQuery) {{
+            document.querySelector('.search-input').value = initialQuery;
+            searchAuthors();
+        }}
+        
         // Add some smooth scrolling
         document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
             anchor.addEventListener('click', function (e) {{
@@ -929,16 +1153,374 @@ def create_html_dashboard():
 </body>
 </html>
     """
+
+    if totals is not None:
+        totals.update(authors=total_authors, books=total_books,
+                      cards=[entry[0] for entry in payload], search_index=search_index)
+
+def create_html_dashboard(full_data, data, path=DASHBOARD_FILE, lazy=True, minify=False, precompress=False,
+                          cache=None):
+    """Write the single-page dashboard; returns {path: sizes} when precompressed, else {}"""
+    # Chunks go straight into the file's write buffer as they are rendered
+    totals = {}
+    chunks = render_dashboard_html(full_data, data, totals, lazy, cache=cache)
+    with atomic_write(path) as f:
+        for chunk in minify_chunks(chunks) if minify else chunks:
+            f.write(chunk)
     
-    # Save the HTML file
-    with open("charm_city_romanticon_2026_backlists.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
-    
-    print("✅ HTML Dashboard created: charm_city_romanticon_2026_backlists.html")
-    print(f"   📊 {total_authors} authors/narrators with {total_books} total books")
+    print(f"✅ HTML Dashboard created: {path}")
+    print(f"   📊 {totals['authors']} authors/narrators with {totals['books']} total books")
     print("   🌐 Just double-click the file to open in your browser!")
     print("   📱 Works on desktop, tablet, and mobile")
+    if precompress:
+        return {path: write_precompressed(path)}
+    remove_precompressed(path)
+    return {}
+
+def plan_pages(people, mode, authors_per_page):
+    """Group the (sorted) author names into [label, names] pages: one per first letter, or fixed-size"""
+    if mode == "letter":
+        pages = {}
+        for person in people:
+            tokens = search_tokens(person)
+            first = tokens[0][0].upper() if tokens else "#"
+            pages.setdefault(first if first.isalpha() else "#", []).append(person)
+        return [[label, pages[label]] for label in sorted(pages)]
+    return [[f"{names[0]} – {names[-1]}", names]
+            for names in (people[i:i + authors_per_page] for i in range(0, len(people), authors_per_page))]
+
+def page_nav_html(label, index_file):
+    return f"""
+        <div class="stats page-nav">
+            📄 Showing <strong>{escape(label)}</strong> &nbsp;•&nbsp;
+            <a href="{escape(index_file)}">← All pages &amp; search everything</a>
+        </div>
+    """
+
+# Search shards are written next to the pages as {stem}-search-NNN.js
+SEARCH_SHARD_INFIX = "-search-"
+
+def shard_search_index(search_index, cards, budget_bytes):
+    """
+    Split the site-wide word index into shards of at most budget_bytes each, as [(prefix, json)].
+    A word goes into the shard with the longest prefix of it; a shard over budget is split by
+    one more letter. Each shard carries the [name, page] of every card it points to.
+    """
+    def shard_json(words):
+        referenced = sorted({card for word in words for card in search_index[word]})
+        return json.dumps({
+            "words": words,
+            "postings": [search_index[word] for word in words],
+            "cards": {card: cards[card] for card in referenced},
+        }, ensure_ascii=False, separators=(",", ":"))
+
+    def split(prefix, words):
+        text = shard_json(words)
+        if len(text.encode("utf-8")) <= budget_bytes:
+            yield prefix, text
+            return
+        # Only the word equal to the prefix itself can't be split further
+        if words[0] == prefix:
+            if len(words) == 1:
+                raise PageWeightError(f"The search entry for '{prefix}' alone is over the page budget")
+            yield from split(prefix, words[:1])
+            words = words[1:]
+        groups = {}
+        for word in words:
+            groups.setdefault(word[:len(prefix) + 1], []).append(word)
+        for key in sorted(groups):
+            yield from split(key, groups[key])
+
+    return list(split("", sorted(search_index)))
+
+def render_index_page(pages, shards, total_authors, total_books):
+    """
+    Small landing page: one link per page with its counts, plus search across every page. The
+    search index lives in the shard scripts (shards is [[prefix, file], ...]), loaded as needed.
+    """
+    index_json = json.dumps({
+        "pages": [[page["file"], page["label"]] for page in pages],
+        "shards": shards,
+    }, ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
+    links = "".join(
+        f'<li><a href="{escape(page["file"])}">{escape(page["label"])}</a> '
+        f'<span class="count">{page["authors"]} authors • {page["books"]} books</span></li>'
+        for page in pages
+    )
+    yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Charm City Romanticon 2026 - Author Backlists</title>
+    <style>
+        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px;
+               background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); min-height: 100vh; }}
+        .container {{ max-width: 900px; margin: 0 auto; background: white; border-radius: 15px; overflow: hidden;
+                     box-shadow: 0 10px 30px rgba(0,0,0,0.2); }}
+        .header {{ background: #EC008C; color: white; padding: 30px; text-align: center; }}
+        .header h1 {{ margin: 0; }}
+        .section {{ padding: 20px 30px; }}
+        .search-input {{ width: 100%; padding: 12px 16px; font-size: 1em; border: 2px solid #EC008C; border-radius: 25px; }}
+        ul {{ list-style: none; padding: 0; }}
+        li {{ padding: 8px 0; border-bottom: 1px solid #eee; }}
+        a {{ color: #EC008C; font-weight: bold; text-decoration: none; }}
+        .count {{ color: #666; font-size: 0.9em; margin-left: 8px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📚 Charm City Romanticon 2026</h1>
+            <p>📊 {total_authors} Authors & Narrators • {total_books} Books</p>
+        </div>
+        <div class="section">
+            <input type="text" class="search-input" placeholder="Search every page: authors, pen names, books, series..."
+                   oninput="scheduleSearch()">
+            <ul id="results"></ul>
+        </div>
+        <div class="section">
+            <ul>{links}</ul>
+        </div>
+    </div>
+    <script type="application/json" id="site-index">{index_json}</script>
+    <script>
+        const site = JSON.parse(document.getElementById('site-index').textContent);
+        const loadedShards = {{}};
+        const shardLoads = {{}};
+        const cardInfo = {{}};
+        let searchTimer = null;
+        
+        // Called by each shard script as it loads
+        function addSearchShard(prefix, shard) {{
+            loadedShards[prefix] = shard;
+            Object.assign(cardInfo, shard.cards);
+        }}
+        
+        // Script tags rather than fetch(), so the pages also work opened straight from disk
+        function loadShard(prefix, file) {{
+            if (!shardLoads[prefix]) {{
+                shardLoads[prefix] = new Promise((resolve, reject) => {{
+                    const script = document.createElement('script');
+                    script.src = file;
+                    script.onload = resolve;
+                    script.onerror = reject;
+                    document.head.appendChild(script);
+                }});
+            }}
+            return shardLoads[prefix];
+        }}
+        
+        // A shard can hold words starting with `word` if either prefix contains the other
+        function shardsFor(word) {{
+            return site.shards.filter(([prefix]) => prefix.startsWith(word) || word.startsWith(prefix));
+        }}
+        
+        function escapeHtml(text) {{
+            return String(text).replace(/[&<>"']/g, c => ({{
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+            }})[c]);
+        }}
+        
+        function cardsForPrefix(prefix) {{
+            const found = new Set();
+            for (const [shardPrefix] of shardsFor(prefix)) {{
+                const shard = loadedShards[shardPrefix];
+                let lo = 0, hi = shard.words.length;
+                while (lo < hi) {{
+                    const mid = (lo + hi) >> 1;
+                    if (shard.words[mid] < prefix) lo = mid + 1; else hi = mid;
+                }}
+                for (let i = lo; i < shard.words.length && shard.words[i].startsWith(prefix); i++) {{
+                    shard.postings[i].forEach(card => found.add(card));
+                }}
+            }}
+            return found;
+        }}
+        
+        function scheduleSearch() {{
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(search, 120);
+        }}
+        
+        // Matching authors link to their page, which reruns the same search there
+        async function search() {{
+            const query = document.querySelector('.search-input').value.trim();
+            const words = query.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase().match(/[\\p{{L}}\\p{{N}}]+/gu) || [];
+            const needed = new Map(words.flatMap(shardsFor));
+            await Promise.all([...needed].map(([prefix, file]) => loadShard(prefix, file)));
+            // A newer search may have started while the shards were loading
+            if (document.querySelector('.search-input').value.trim() !== query) return;
+            let matches = null;
+            for (const word of words) {{
+                const found = cardsForPrefix(word);
+                matches = matches === null ? found : new Set([...matches].filter(card => found.has(card)));
+            }}
+            const results = matches === null ? [] : [...matches].sort((a, b) => a - b).slice(0, 100);
+            document.getElementById('results').innerHTML = results.map(card => {{
+                const [name, page] = cardInfo[card];
+                const [file, label] = site.pages[page];
+                return `<li><a href="${{escapeHtml(file)}}?q=${{encodeURIComponent(query)}}">${{escapeHtml(name)}}</a>` +
+                       `<span class="count">${{escapeHtml(label)}}</span></li>`;
+            }}).join('') || (query ? '<li>No matches</li>' : '');
+        }}
+    </script>
+</body>
+</html>
+"""
+
+def render_page_within_budget(full_data, data, label, index_file, budget_bytes, lazy, minify=False, cache=None):
+    """
+    Render one page into memory, giving up as soon as it passes the budget (measured after minifying).
+    Returns (chunks, totals), or (None, None) if the page is too big.
+    """
+    totals = {}
+    chunks = []
+    size = 0
+    pages = render_dashboard_html(full_data, data, totals, lazy, page_nav_html(label, index_file), cache)
+    for chunk in minify_chunks(pages) if minify else pages:
+        chunks.append(chunk)
+        size += len(chunk.encode("utf-8"))
+        if size > budget_bytes:
+            pages.close()
+            return None, None
+    return chunks, totals
+
+def create_paged_dashboard(full_data, data, path=DASHBOARD_FILE, mode="letter", authors_per_page=250,
+                           budget_kb=1024, lazy=True, minify=False, precompress=False, cache=None):
+    """
+    Write the dashboard as several pages plus an index page at `path` with per-page counts and
+    search across all of them. A page that would go over budget_kb is split in half until it fits,
+    and the site-wide search is split into shard scripts under the same budget. Raises
+    PageWeightError if something can't be brought under it (a single author, or the index page);
+    nothing from an earlier build is touched until every new file has been written.
+    Returns {path: sizes} for the index, every page and every shard when precompressed, else {}.
+    """
+    if not set(NORMALIZED_DTYPES) <= set(full_data.columns):
+        full_data = normalize_books(full_data)
+    roster_by_name = index_roster(data)
+    books_by_author = index_books_by_author(full_data)
+    people = [person for person in sorted(full_data["Author"].dropna().unique()) if person in roster_by_name]
+
+    stem, ext = os.path.splitext(path)
+    index_file = os.path.basename(path)
+    budget_bytes = int(budget_kb * 1024)
+    pages = []
+    cards = []
+    site_index = {}
+    weights = {}
+    # Pages and shards go to .tmp files and are moved into place only once the whole build has
+    # succeeded, so a failed or interrupted run leaves the previous site intact
+    staged = []
+    try:
+        todo = plan_pages(people, mode, authors_per_page)
+        while todo:
+            label, names = todo.pop(0)
+            keys = {name.lower() for name in names}
+            rows = sorted(position for key in keys for position in books_by_author[key])
+            subset = full_data.iloc[rows]
+            chunks, totals = render_page_within_budget(subset, data, label, index_file, budget_bytes, lazy, minify,
+                                                       cache)
+            if chunks is None and len(names) > 1:
+                half = len(names) // 2
+                todo[:0] = [[f"{label} ({names[0]} – {names[half - 1]})", names[:half]],
+                            [f"{label} ({names[half]} – {names[-1]})", names[half:]]]
+                continue
+            if chunks is None:
+                raise PageWeightError(f"{names[0]} alone is over the {budget_kb} KB page budget; "
+                                      "raise --page-budget-kb")
+
+            page_file = f"{stem}-{len(pages) + 1:03d}{ext}"
+            staged.append(page_file)
+            with open(page_file + ".tmp", "w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as f:
+                f.writelines(chunks)
+            page_number = len(pages)
+            pages.append({"file": os.path.basename(page_file), "label": label,
+                          "authors": totals["authors"], "books": totals["books"]})
+            # Cards are numbered site-wide on the index page
+            offset = len(cards)
+            cards.extend([name, page_number] for name in totals["cards"])
+            for word, postings in totals["search_index"].items():
+                site_index.setdefault(word, []).extend(card + offset for card in postings)
+
+        shards = []
+        for number, (prefix, shard_json) in enumerate(shard_search_index(site_index, cards, budget_bytes), start=1):
+            shard_file = f"{stem}{SEARCH_SHARD_INFIX}{number:03d}.js"
+            staged.append(shard_file)
+            with open(shard_file + ".tmp", "w", encoding="utf-8") as f:
+                f.write(f"addSearchShard({json.dumps(prefix, ensure_ascii=False)}, {shard_json});\n")
+            shards.append([prefix, os.path.basename(shard_file)])
+
+        total_authors = sum(page["authors"] for page in pages)
+        total_books = sum(page["books"] for page in pages)
+        chunks = render_index_page(pages, shards, total_authors, total_books)
+        index_chunks = list(minify_chunks(chunks) if minify else chunks)
+        index_kb = sum(len(chunk.encode("utf-8")) for chunk in index_chunks) / 1024
+        if index_kb > budget_kb:
+            raise PageWeightError(f"The index page is {index_kb:.0f} KB, over the {budget_kb} KB budget "
+                                  "(it links every page; raise --authors-per-page or --page-budget-kb)")
+    except BaseException:
+        for staged_file in staged:
+            if os.path.exists(staged_file + ".tmp"):
+                os.remove(staged_file + ".tmp")
+        raise
+
+    for staged_file in staged:
+        os.replace(staged_file + ".tmp", staged_file)
+        if precompress:
+            weights[staged_file] = write_precompressed(staged_file)
+    with atomic_write(path) as f:
+        f.writelines(index_chunks)
+    if precompress:
+        weights = {path: write_precompressed(path), **weights}
+    else:
+        remove_precompressed(path)
+    # Only now that the new index is in place can pages and shards of an earlier, bigger run go
+    produced = set(staged) | {f"{file}.{kind}" for file, sizes in weights.items() for kind in sizes if kind != "raw"}
+    for pattern in (f"{glob.escape(stem)}-[0-9][0-9][0-9]{glob.escape(ext)}*",
+                    f"{glob.escape(stem)}{SEARCH_SHARD_INFIX}[0-9][0-9][0-9].js*"):
+        for stale in glob.glob(pattern):
+            if stale not in produced:
+                os.remove(stale)
+
+    print(f"✅ HTML Dashboard created: {path} + {len(pages)} pages ({stem}-001{ext} ...)")
+    print(f"   📊 {total_authors} authors/narrators with {total_books} total books")
+    print(f"   🔎 Site-wide search split into {len(shards)} shard scripts ({stem}{SEARCH_SHARD_INFIX}001.js ...)")
+    print("   🌐 Keep the pages together in one folder and open the index page")
+    return weights
+
+def main():
+    args = build_arg_parser().parse_args()
+    apply_fetch_arguments(args)
+
+    print("[1/2] Scraping Goodreads backlists...")
+    data = load_roster()
+    full_data = scrape_phase(args, data)
+
+    print("[2/2] Building HTML dashboard...")
+    # Create the beautiful HTML dashboard
+    precompress = args.precompress or args.weight_budget_kb is not None
+    cache = card_cache.configure(enabled=not args.no_card_cache)
+    try:
+        if args.pages == "single":
+            weights = create_html_dashboard(full_data, data, lazy=args.tables == "lazy",
+                                            minify=args.minify, precompress=precompress, cache=cache)
+        else:
+            weights = create_paged_dashboard(full_data, data, mode=args.pages,
+                                             authors_per_page=args.authors_per_page,
+                                             budget_kb=args.page_budget_kb, lazy=args.tables == "lazy",
+                                             minify=args.minify, precompress=precompress, cache=cache)
+        if weights:
+            report_page_weight(weights, args.weight_budget_kb)
+    except PageWeightError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        if cache is not None:
+            print(f"   {cache.stats()}")
+            cache.close()
+    print("\n🎉 Done! No more Excel drama - just pure HTML awesomeness!")
 
-# Create the beautiful HTML dashboard
-create_html_dashboard()
-print("\n🎉 Done! No more Excel drama - just pure HTML awesomeness!")
\ No newline at end of file
+# Worker processes re-import this module, so nothing may run at import time
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# goodreads_parser.py (turns downloaded Goodreads pages into author links and book records)
+
+import os
+from bs4 import BeautifulSoup, SoupStrainer
+from date_extraction import extract_published_date
+
+try:
+    import lxml  # noqa: F401  (only needed as a BeautifulSoup tree builder)
+    HAVE_LXML = True
+except ImportError:
+    HAVE_LXML = False
+
+# "fast" = lxml (when installed) building only the nodes we read; "html.parser" = the original full parse
+PARSER_CHOICES = ["fast", "html.parser"]
+DEFAULT_PARSER = "fast"
+_parser = DEFAULT_PARSER
+
+# Per-book/per-element console output; turn on with --debug or BACKLIST_DEBUG=1
+DEBUG = os.environ.get("BACKLIST_DEBUG", "") not in ("", "0")
+
+# The only parts of each page the scraper looks at
+SEARCH_STRAINER = SoupStrainer("a", class_="authorName")
+BOOK_ROW_STRAINER = SoupStrainer("tr", attrs={"itemtype": "http://schema.org/Book"})
+
+
+def set_parser(name):
+    global _parser
+    if name not in PARSER_CHOICES:
+        raise ValueError(f"Unknown parser '{name}' (choose from {', '.join(PARSER_CHOICES)})")
+    _parser = name
+
+
+def current_parser():
+    return _parser
+
+
+def set_debug(enabled):
+    global DEBUG
+    DEBUG = enabled
+
+
+def make_soup(html, strainer, parser=None):
+    """Build a BeautifulSoup tree with the selected backend"""
+    if (parser or _parser) == "fast":
+        return BeautifulSoup(html, "lxml" if HAVE_LXML else "html.parser", parse_only=strainer)
+    return BeautifulSoup(html, "html.parser")
+
+# Pull the first author link (and the name it is shown under) out of a Goodreads author search results page
+def parse_author_match(html, author_name, parser=None):
+    soup = make_soup(html, SEARCH_STRAINER, parser)
+    author_link_tag = soup.select_one("a.authorName")
+    if author_link_tag:
+        author_link = author_link_tag["href"]
+        if author_link.startswith("/"):
+            author_link = "https://www.goodreads.com" + author_link
+        return author_link, author_link_tag.get_text(" ", strip=True)
+    else:
+        print(f"No author page found for {author_name}")
+        return None, ""
+
+# Parse the book rows out of an already-downloaded Goodreads book list page
+def parse_goodreads_books(html, name, role, pen_name, parser=None):
+    books = []
+    soup = make_soup(html, BOOK_ROW_STRAINER, parser)
+
+    book_containers = soup.select("tr[itemtype='http://schema.org/Book']")
+    
+    print(f"Found {len(book_containers)} books for {name}")
+    
+    try:
+        for book in book_containers:
+            title_tag = book.select_one("a.bookTitle span")
+            title = title_tag.text.strip() if title_tag else "Unknown Title"
+
+            series_tag = book.select_one("span.greyText.smallText")
+
+            series_title = ""
+            series_order = ""
+
+            if series_tag and "Series" in series_tag.text:
+                series_info = series_tag.text.strip()
+                try:
+                    # Extract series name and order
+                    series_title, series_order = series_info.replace("Series:", "").strip().rsplit("(", 1)
+                    series_order = series_order.replace(")", "").replace("#", "").strip()
+                    series_title = series_title.strip()
+                except ValueError:
+                    series_title = series_info.strip()
+                    series_order = ""
+
+            # Publication date: single pass over this book's .greyText snippets
+            date_texts = [elem.get_text().strip() for elem in book.select('.greyText')]
+            published_date, date_precision = extract_published_date(date_texts, debug=DEBUG)
+
+            if not published_date and DEBUG:
+                print(f"  ⚠️  No date found for '{title}'")
+
+            if role == "Narrator":
+                formats = "Ebook, Paperback, Audiobook"  # Default formats for narrators
+            else:
+                formats = "Ebook, Paperback" # Default formats
+
+            book_data = {
+                "Author": name,
+                "Book Title": title,
+                "Series Title": series_title,
+                "Series Order": series_order,
+                "Published Date": published_date,  # ISO date: YYYY-MM-DD, YYYY-MM or YYYY
+                "Formats Available": formats,  # Use the defult format
+                "Standalone/Series": "Series" if series_title else "Standalone",
+                "Pen Name": pen_name,  # Fixed: was empty, now uses the parameter
+                "Role": role,  # Fixed: was "Book Role", now uses correct field name
+                "Date Precision": date_precision  # "day", "month" or "year"
+            }
+            
+            books.append(book_data)
+            if DEBUG:
+                print(f"  📚 Added '{title}'")
+
+    except Exception as e:
+        print(f"❌ Error scraping books for {name}: {e}")
+
+    return books
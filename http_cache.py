@@ -0,0 +1,203 @@
+# http_cache.py (on-disk HTTP response cache with ETag/Last-Modified revalidation)
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import http_session
+
+CACHE_DIR = ".http_cache"
+# How long a cached page is served without asking Goodreads at all
+DEFAULT_TTL = 7 * 24 * 3600
+# Once the stored bodies exceed this, least-recently-used entries are evicted
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    Response bodies live in objects/ named by the SHA-256 of their content, so identical
+    pages are stored once. index.sqlite maps each URL to its body plus the validators
+    (ETag, Last-Modified) needed to revalidate it once the TTL runs out.
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.lock = threading.Lock()
+
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(directory, "index.sqlite"), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                body_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used)")
+        self.conn.commit()
+
+    def _object_path(self, body_hash):
+        return os.path.join(self.directory, "objects", body_hash[:2], body_hash)
+
+    def _read_body(self, body_hash):
+        try:
+            with open(self._object_path(body_hash), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _lookup(self, url):
+        return self.conn.execute(
+            "SELECT body_hash, etag, last_modified, fetched_at FROM entries WHERE url = ?", (url,)
+        ).fetchone()
+
+    def get_fresh(self, url):
+        """Return the cached body if it is still inside its TTL, otherwise None. Never hits the network."""
+        with self.lock:
+            row = self._lookup(url)
+            if row is None or time.time() - row[3] > self.ttl:
+                return None
+            body = self._read_body(row[0])
+            if body is None:
+                self.conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+                self.conn.commit()
+                return None
+            self.conn.execute("UPDATE entries SET last_used = ? WHERE url = ?", (time.time(), url))
+            self.conn.commit()
+            self.hits += 1
+            return body
+
+    def fetch(self, url):
+        """Return the body for `url`, from disk if fresh, otherwise via a (conditional) GET"""
+        body = self.get_fresh(url)
+        if body is not None:
+            return body
+        return self.revalidate(url)
+
+    def revalidate(self, url, conditional=True):
+        """GET `url` with If-None-Match/If-Modified-Since so an unchanged page costs a 304"""
+        with self.lock:
+            row = self._lookup(url) if conditional else None
+
+        request_headers = {}
+        if row is not None:
+            if row[1]:
+                request_headers["If-None-Match"] = row[1]
+            if row[2]:
+                request_headers["If-Modified-Since"] = row[2]
+
+        response = http_session.get(url, headers=request_headers)
+        if response.status_code == 304 and row is not None:
+            body = self._read_body(row[0])
+            if body is None:
+                # Index said we had it but the object is gone - fetch it for real
+                return self.revalidate(url, conditional=False)
+            with self.lock:
+                now = time.time()
+                self.conn.execute("UPDATE entries SET fetched_at = ?, last_used = ? WHERE url = ?", (now, now, url))
+                self.conn.commit()
+                self.revalidated += 1
+            return body
+
+        response.raise_for_status()
+        body = response.text
+        self.store(url, body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        with self.lock:
+            self.misses += 1
+        return body
+
+    def store(self, url, body, etag=None, last_modified=None):
+        data = body.encode("utf-8")
+        body_hash = hashlib.sha256(data).hexdigest()
+        path = self._object_path(body_hash)
+        # Object file and index row are written under one lock, so another thread dropping
+        # an unused object can never delete this body between the two
+        with self.lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            now = time.time()
+            old = self._lookup(url)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (url, body_hash, etag, last_modified, fetched_at, last_used, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body_hash, etag, last_modified, now, now, len(data))
+            )
+            if old is not None and old[0] != body_hash:
+                self._drop_object_if_unused(old[0])
+            self._evict()
+            self.conn.commit()
+
+    def _drop_object_if_unused(self, body_hash):
+        """Delete the body's object file once no entry refers to it; True if it went"""
+        still_used = self.conn.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone()
+        if still_used:
+            return False
+        try:
+            os.remove(self._object_path(body_hash))
+        except FileNotFoundError:
+            pass
+        return True
+
+    def _evict(self):
+        """Drop least-recently-used entries until the stored objects fit in max_bytes"""
+        # Each object counts once, however many URLs share its body
+        total = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT body_hash, size FROM entries)"
+        ).fetchone()[0]
+        while total > self.max_bytes:
+            row = self.conn.execute("SELECT url, body_hash, size FROM entries ORDER BY last_used LIMIT 1").fetchone()
+            if row is None:
+                break
+            self.conn.execute("DELETE FROM entries WHERE url = ?", (row[0],))
+            if self._drop_object_if_unused(row[1]):
+                total -= row[2]
+
+    def stats(self):
+        return f"HTTP cache: {self.hits} hits, {self.revalidated} revalidated (304), {self.misses} misses"
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+_default_cache = None
+_configured = False
+
+
+def configure(enabled=True, directory=CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+    """Set up the cache every fetch goes through (or turn caching off)"""
+    global _default_cache, _configured
+    _default_cache = ResponseCache(directory, ttl, max_bytes) if enabled else None
+    _configured = True
+    return _default_cache
+
+
+def default_cache():
+    if not _configured:
+        configure()
+    return _default_cache
+
+
+def fetch_text(url):
+    """Blocking GET that goes through the default cache when one is configured"""
+    cache = default_cache()
+    if cache is not None:
+        return cache.fetch(url)
+    response = http_session.get(url)
+    response.raise_for_status()
+    return response.text
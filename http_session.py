@@ -0,0 +1,55 @@
+# http_session.py (one pooled keep-alive session shared by every script)
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Headers to mimic a real browser visit
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+}
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (10, 30)
+# Number of hosts to keep pools for (goodreads.com, googleapis.com, ...)
+POOL_CONNECTIONS = 10
+# Keep-alive connections kept open per host; raised to the fetcher's max in flight by set_pool_size()
+DEFAULT_POOL_MAXSIZE = 16
+
+_session = None
+_session_lock = threading.Lock()
+_pool_maxsize = DEFAULT_POOL_MAXSIZE
+
+
+def set_pool_size(size):
+    """Keep at least `size` connections per host open, so no concurrent request has to drop one"""
+    global _session, _pool_maxsize
+    with _session_lock:
+        if size <= _pool_maxsize:
+            return
+        _pool_maxsize = size
+        if _session is not None:
+            # The next request builds a new session with the bigger pool
+            _session.close()
+            _session = None
+
+
+def get_session():
+    """Return the process-wide requests.Session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=_pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(HEADERS)
+            _session = session
+        return _session
+
+
+def get(url, **kwargs):
+    """requests.get() through the shared session, with the default timeout applied"""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().get(url, **kwargs)
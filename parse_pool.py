@@ -0,0 +1,67 @@
+# parse_pool.py (process-pool parsing stage fed by a bounded queue of fetched pages)
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import goodreads_parser
+
+# Leave one core for the event loop that keeps the fetcher busy
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+
+def _init_worker(parser, debug):
+    """Worker processes start fresh, so hand them the parser settings chosen on the command line"""
+    goodreads_parser.set_parser(parser)
+    goodreads_parser.set_debug(debug)
+
+
+class ParsePool:
+    """
+    Fetched page bodies go onto a bounded queue; `workers` consumers hand them to a
+    ProcessPoolExecutor, which returns plain book records. When parsing falls behind, the
+    full queue makes fetch tasks wait instead of piling pages up in memory.
+    Must be created inside a running event loop.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, queue_size=None):
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(goodreads_parser.current_parser(), goodreads_parser.DEBUG)
+        )
+        self.queue = asyncio.Queue(maxsize=queue_size or workers * 4)
+        self.consumers = [asyncio.ensure_future(self._consume()) for _ in range(workers)]
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, future = await self.queue.get()
+            try:
+                result = await loop.run_in_executor(self.executor, func, *args)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self.queue.task_done()
+
+    async def parse(self, func, *args):
+        """Queue func(*args) for a worker process and wait for its result"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((func, args, future))
+        return await future
+
+    async def close(self):
+        for consumer in self.consumers:
+            consumer.cancel()
+        await asyncio.gather(*self.consumers, return_exceptions=True)
+        self.executor.shutdown(wait=True)
+
+
+async def parse_page(pool, func, *args):
+    """Run a parse function in the pool, or inline when there is no pool (--workers 0)"""
+    if pool is None:
+        return func(*args)
+    return await pool.parse(func, *args)
@@ -1,173 +1,135 @@
 # scrape_goodreads_backlist.py (FIXED VERSION)
 
-import requests
+import argparse
+import asyncio
+import hashlib
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import re
+from collections import deque
+import http_cache
+import author_index
+from backlist_store import open_store, LEGACY_XLSX
+import goodreads_parser
+import xlsx_writers
+from goodreads_parser import parse_author_match, parse_goodreads_books
+from fetch_engine import AsyncFetcher, DEFAULT_RATE, DEFAULT_BURST, DEFAULT_MAX_IN_FLIGHT
+from parse_pool import ParsePool, parse_page, DEFAULT_WORKERS
 
-# Load author names from your xlsx
-author_df = pd.read_excel("announced_authors.xlsx", engine='openpyxl')
-authors = author_df["Author Name"].dropna().tolist()
+# Goodreads lists an author's books 30 to a page on /author/list/
+BOOKS_PER_PAGE = 30
+# Safety cap so a mis-resolved mega-author can't crawl forever
+DEFAULT_MAX_PAGES = 20
+# How many upcoming list pages to request while the current one is being parsed
+DEFAULT_PREFETCH = 3
+PAGE_LINK_PATTERN = re.compile(r'[?&](?:amp;)?page=(\d+)')
+BOOK_LINK_PATTERN = re.compile(r'/book/show/(\d+)')
+BOOK_TOTAL_PATTERN = re.compile(r'Showing\s+\d+\s*-\s*\d+\s+of\s+([\d,]+)')
 
-# Headers to mimic a real browser visit
-headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
-}
+def author_search_url(author_name):
+    return f"https://www.goodreads.com/search?q={author_name.replace(' ', '+')}&search_type=authors"
 
-# Function to search Goodreads for an author
+# Function to find an author's Goodreads page, searching only if the author index doesn't know it yet
 def search_goodreads_author(author_name):
-    search_url = f"https://www.goodreads.com/search?q={author_name.replace(' ', '+')}&search_type=authors"
-    response = requests.get(search_url, headers=headers)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-    author_link_tag = soup.select_one("a.authorName")
-    if author_link_tag:
-        author_link = author_link_tag["href"]
-        if author_link.startswith("/"):
-            author_link = "https://www.goodreads.com" + author_link
-        return author_link
-    else:
-        print(f"No author page found for {author_name}")
-        return None
+    index = author_index.default_index()
+    resolution = index.lookup(author_name) if index is not None else None
+    if resolution is not None:
+        return resolution.author_url or None
+    html = http_cache.fetch_text(author_search_url(author_name))
+    author_url, matched_name = parse_author_match(html, author_name)
+    if index is not None:
+        index.record_search(author_name, author_url, matched_name)
+    return author_url
 
-# Function to scrape books from author's Goodreads page
-def scrape_goodreads_books(author_url, name, role, pen_name):
-    books = []
-    response = requests.get(author_url, headers=headers)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+# Function to scrape books from author's Goodreads page (every page of their book list)
+def scrape_goodreads_books(author_url, name, role, pen_name, max_pages=DEFAULT_MAX_PAGES):
+    return list(iter_goodreads_books(author_url, name, role, pen_name, max_pages))
+
+def author_list_url(author_url, page=1):
+    """Turn an /author/show/ link into the paginated /author/list/ page that has every book"""
+    base_url = author_url.split("?")[0].replace("/author/show/", "/author/list/")
+    return f"{base_url}?page={page}&per_page={BOOKS_PER_PAGE}"
+
+def parse_last_page(html):
+    """Highest page number linked from a book list page's pagination (1 if there is none)"""
+    pages = [int(page) for page in PAGE_LINK_PATTERN.findall(html)]
+    return max(pages, default=1)
+
+def list_fingerprint(html):
+    """
+    Hash of what identifies an author's list: the book total and the books on the first page.
+    Ratings, ads and other page furniture are left out, so it only changes when the list does.
+    """
+    total = BOOK_TOTAL_PATTERN.search(html)
+    book_ids = sorted(set(BOOK_LINK_PATTERN.findall(html)))
+    content = f"{total.group(1) if total else ''}|{parse_last_page(html)}|{','.join(book_ids)}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+async def iter_goodreads_books_async(fetcher, author_url, name, role, pen_name,
+                                     max_pages=DEFAULT_MAX_PAGES, prefetch=DEFAULT_PREFETCH, pool=None,
+                                     first_page=None, revalidate=False):
+    """
+    Async generator over every book on an author's list, yielded page by page as pages arrive.
+    Up to `prefetch` later pages are requested concurrently (still inside the fetcher's rate limit)
+    while earlier ones are parsed - in worker processes when a ParsePool is given.
+    Pass first_page if it has already been downloaded; revalidate=True re-checks cached pages.
+    """
+    if first_page is None:
+        first_page = await fetcher.fetch(author_list_url(author_url, 1), revalidate)
+    total_pages = parse_last_page(first_page)
+    last_page = min(total_pages, max_pages)
+
+    pending = deque()
+    next_page = 2
+    # With nothing requested ahead the crawl would stop after page 1
+    prefetch = max(1, prefetch)
+
+    def top_up():
+        nonlocal next_page
+        while next_page <= last_page and len(pending) < prefetch:
+            pending.append(asyncio.ensure_future(fetcher.fetch(author_list_url(author_url, next_page), revalidate)))
+            next_page += 1
 
-    book_containers = soup.select("tr[itemtype='http://schema.org/Book']")
-    
-    print(f"Found {len(book_containers)} books for {name}")
-    
     try:
-        for book in book_containers:
-            title_tag = book.select_one("a.bookTitle span")
-            title = title_tag.text.strip() if title_tag else "Unknown Title"
-
-            series_tag = book.select_one("span.greyText.smallText")
-
-            series_title = ""
-            series_order = ""
-
-            if series_tag and "Series" in series_tag.text:
-                series_info = series_tag.text.strip()
-                try:
-                    # Extract series name and order
-                    series_title, series_order = series_info.replace("Series:", "").strip().rsplit("(", 1)
-                    series_order = series_order.replace(")", "").replace("#", "").strip()
-                    series_title = series_title.strip()
-                except ValueError:
-                    series_title = series_info.strip()
-                    series_order = ""
-
-            # DATE SCRAPING - FIXED VERSION
-            published_date = ""
-            
-            try:
-                # Look for publication date within THIS specific book container
-                date_elements = book.select('.greyText')
-                
-                for i, elem in enumerate(date_elements):
-                    text = elem.get_text().strip()
-                    print(f"  Checking date element {i+1}: '{text[:100]}...'")  # Debug output (truncated)
-                    
-                    # Skip if this is clearly ONLY a rating element or ONLY editions
-                    if ('rate this book' in text.lower() and 'published' not in text.lower()) or \
-                       (text.lower().strip().endswith('editions') and 'published' not in text.lower()):
-                        print(f"    Skipping non-date element")
-                        continue
-                    
-                    # Look for the word "published" in the text - this is our main indicator
-                    if 'published' in text.lower():
-                        print(f"    Found 'published' in text, parsing...")
-                        
-                        # Pattern for "published Month Day, Year"
-                        date_pattern1 = r'published\s+([A-Za-z]+\s+\d{1,2},\s+\d{4})'
-                        match1 = re.search(date_pattern1, text, re.IGNORECASE)
-                        if match1:
-                            published_date = match1.group(1)
-                            print(f"  ✅ Found date (pattern 1): {published_date}")
-                            break
-                        
-                        # Pattern for "published Year" (like "published 2021")
-                        date_pattern_year = r'published\s+(\d{4})'
-                        match_year = re.search(date_pattern_year, text, re.IGNORECASE)
-                        if match_year:
-                            published_date = match_year.group(1)
-                            print(f"  ✅ Found year (published pattern): {published_date}")
-                            break
-                        
-                        # Pattern for "published Month Year" (like "published March 2021")
-                        date_pattern_month_year = r'published\s+([A-Za-z]+\s+\d{4})'
-                        match_month_year = re.search(date_pattern_month_year, text, re.IGNORECASE)
-                        if match_month_year:
-                            published_date = match_month_year.group(1)
-                            print(f"  ✅ Found month/year (published pattern): {published_date}")
-                            break
-                    
-                    # If no "published" found, try general date patterns (but be more careful)
-                    else:
-                        # Pattern for just "Month Day, Year"
-                        date_pattern2 = r'\b([A-Za-z]+\s+\d{1,2},\s+\d{4})\b'
-                        match2 = re.search(date_pattern2, text)
-                        if match2:
-                            published_date = match2.group(1)
-                            print(f"  ✅ Found date (pattern 2): {published_date}")
-                            break
-                        
-                        # Pattern for just a year (4 digits) - only if not in ratings context
-                        if 'avg rating' not in text.lower():
-                            date_pattern3 = r'\b(\d{4})\b'
-                            match3 = re.search(date_pattern3, text)
-                            if match3:
-                                year = match3.group(1)
-                                # Make sure it's a reasonable publication year
-                                if 1900 <= int(year) <= 2030:
-                                    published_date = year
-                                    print(f"  ✅ Found year: {published_date}")
-                                    break
-                
-            except Exception as e:
-                print(f"  ❌ Error extracting date for '{title}': {e}")
-
-            # If still no date found, report it
-            if not published_date:
-                print(f"  ⚠️  No date found for '{title}'")
-
-            if role == "Narrator":
-                formats = "Ebook, Paperback, Audiobook"  # Default formats for narrators
-            else:
-                formats = "Ebook, Paperback" # Default formats
-
-            book_data = {
-                "Author": name,
-                "Book Title": title,
-                "Series Title": series_title,
-                "Series Order": series_order,
-                "Published Date": published_date,  # This should now work!
-                "Formats Available": formats,  # Use the defult format
-                "Standalone/Series": "Series" if series_title else "Standalone",
-                "Pen Name": pen_name,  # Fixed: was empty, now uses the parameter
-                "Role": role  # Fixed: was "Book Role", now uses correct field name
-            }
-            
-            books.append(book_data)
-            print(f"  📚 Added '{title}'")
+        top_up()
+        html = first_page
+        while html is not None:
+            for book in await parse_page(pool, parse_goodreads_books, html, name, role, pen_name):
+                yield book
+            top_up()
+            html = await pending.popleft() if pending else None
+    finally:
+        for task in pending:
+            task.cancel()
 
-    except Exception as e:
-        print(f"❌ Error scraping books for {name}: {e}")
+    if total_pages > max_pages:
+        print(f"⚠️  {pen_name}: stopped after {max_pages} of {total_pages} pages (raise --max-pages to get the rest)")
+
+def iter_goodreads_books(author_url, name, role, pen_name, max_pages=DEFAULT_MAX_PAGES, prefetch=DEFAULT_PREFETCH):
+    """Blocking generator over iter_goodreads_books_async, for scripts and debugging sessions"""
+    loop = asyncio.new_event_loop()
 
-    return books
+    async def start():
+        return AsyncFetcher(cache=http_cache.default_cache())
+
+    fetcher = loop.run_until_complete(start())
+    books = iter_goodreads_books_async(fetcher, author_url, name, role, pen_name, max_pages, prefetch)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(books.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(books.aclose())
+        fetcher.close()
+        loop.close()
 
 # Alternative debugging approach - add this to see what's actually on the page:
 def debug_goodreads_page(author_url):
     """Debug function to see what's actually on a Goodreads author page"""
     try:
-        response = requests.get(author_url, headers=headers)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(http_cache.fetch_text(author_url), 'html.parser')
         
         print(f"\n🔍 DEBUGGING PAGE: {author_url}")
         
@@ -199,6 +161,150 @@ def debug_goodreads_page(author_url):
     except Exception as e:
         print(f"❌ Debug error: {e}")
 
+# Async version of search + scrape for one name, sharing the fetcher's rate limits.
+# Returns (books, complete, fingerprint) - complete is False if a request failed part-way through.
+# With known_fingerprint, the first list page is revalidated and books is None if it hasn't changed.
+async def scrape_name_async(fetcher, search_name, name, role, pen_name,
+                            max_pages=DEFAULT_MAX_PAGES, prefetch=DEFAULT_PREFETCH, pool=None,
+                            known_fingerprint=None):
+    books = []
+    fingerprint = ""
+    refreshing = known_fingerprint is not None
+    try:
+        index = author_index.default_index()
+        resolution = index.lookup(search_name) if index is not None else None
+        if resolution is not None:
+            author_url = resolution.author_url
+        else:
+            search_html = await fetcher.fetch(author_search_url(search_name))
+            author_url, matched_name = await parse_page(pool, parse_author_match, search_html, search_name)
+            # A name that had a list before is not remembered as a miss on the strength of one search
+            if index is not None and (author_url or not known_fingerprint):
+                index.record_search(search_name, author_url, matched_name)
+        if not author_url:
+            if known_fingerprint:
+                # Found last time: a captcha page or layout change must not wipe the stored books
+                print(f"⚠️  {search_name}: no author found this time; keeping the stored books")
+                return None, False, known_fingerprint
+            # Nobody to crawl; unchanged if nobody was found last time either
+            return (None if refreshing else []), True, ""
+        first_page = await fetcher.fetch(author_list_url(author_url, 1), revalidate=refreshing)
+        fingerprint = list_fingerprint(first_page)
+        if refreshing and fingerprint == known_fingerprint:
+            return None, True, fingerprint
+        async for book in iter_goodreads_books_async(fetcher, author_url, name, role, pen_name,
+                                                     max_pages, prefetch, pool, first_page, refreshing):
+            books.append(book)
+    except Exception as e:
+        # Keep whatever pages made it through; the rest will be picked up on the next run
+        print(f"❌ Error scraping {search_name} for {name}: {e}")
+        return books, False, fingerprint
+    return books, True, fingerprint
+
+async def scrape_names_async(jobs, rate=DEFAULT_RATE, burst=DEFAULT_BURST, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                             max_pages=DEFAULT_MAX_PAGES, prefetch=DEFAULT_PREFETCH, workers=DEFAULT_WORKERS,
+                             fingerprints=None, on_result=None):
+    fingerprints = fingerprints or {}
+    pool = ParsePool(workers) if workers > 0 and jobs else None
+    try:
+        async with AsyncFetcher(rate=rate, burst=burst, max_in_flight=max_in_flight,
+                                cache=http_cache.default_cache()) as fetcher:
+            async def run_job(job):
+                search_name, name = job[0], job[1]
+                books, complete, fingerprint = await scrape_name_async(
+                    fetcher, *job, max_pages=max_pages, prefetch=prefetch, pool=pool,
+                    known_fingerprint=fingerprints.get((name, search_name))
+                )
+                if on_result:
+                    on_result(job, books, complete, fingerprint)
+                return books
+
+            return await asyncio.gather(*(run_job(job) for job in jobs))
+    finally:
+        if pool is not None:
+            await pool.close()
+
+def scrape_names(jobs, rate=DEFAULT_RATE, burst=DEFAULT_BURST, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 max_pages=DEFAULT_MAX_PAGES, prefetch=DEFAULT_PREFETCH, workers=DEFAULT_WORKERS,
+                 fingerprints=None, on_result=None):
+    """
+    Scrape many names concurrently. Each job is (search_name, author, role, pen_name).
+    Returns one list of books per job, in the same order as `jobs`.
+    Throughput is set by the per-host token bucket, not by round-trip latency; parsing
+    runs in `workers` processes (0 = parse inline on the event loop).
+    fingerprints maps (author, search_name) to the list fingerprint from an earlier scrape; those
+    names are only re-crawled if their first list page changed, otherwise their books are None.
+    on_result(job, books, complete, fingerprint) is called as soon as each job finishes.
+    """
+    return asyncio.run(scrape_names_async(jobs, rate, burst, max_in_flight, max_pages, prefetch, workers,
+                                          fingerprints, on_result))
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def add_fetch_arguments(parser):
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help=f"Requests per second allowed per host (default: {DEFAULT_RATE})")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST,
+                        help=f"Requests a host may receive back-to-back (default: {DEFAULT_BURST})")
+    parser.add_argument("--max-in-flight", type=positive_int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help=f"Maximum concurrent requests (default: {DEFAULT_MAX_IN_FLIGHT})")
+    parser.add_argument("--max-pages", type=positive_int, default=DEFAULT_MAX_PAGES,
+                        help=f"Most book-list pages to crawl per name, {BOOKS_PER_PAGE} books each (default: {DEFAULT_MAX_PAGES})")
+    parser.add_argument("--prefetch", type=positive_int, default=DEFAULT_PREFETCH,
+                        help=f"Book-list pages to request ahead of the one being parsed (default: {DEFAULT_PREFETCH})")
+    parser.add_argument("--cache-ttl", type=float, default=http_cache.DEFAULT_TTL / 3600,
+                        help="Hours a cached Goodreads page is reused before revalidating (default: %(default)s)")
+    parser.add_argument("--cache-max-mb", type=float, default=http_cache.DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="Size cap for the on-disk response cache (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Processes parsing downloaded pages; 0 parses inline (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--parser", choices=goodreads_parser.PARSER_CHOICES, default=goodreads_parser.DEFAULT_PARSER,
+                        help="HTML parsing backend: 'fast' parses only the nodes we read (default: %(default)s)")
+    parser.add_argument("--refresh-authors", action="store_true",
+                        help="Search Goodreads again for every name instead of trusting the author index "
+                             "(manual entries are kept)")
+    parser.add_argument("--debug", action="store_true",
+                        help="Print per-book and per-date-element parsing details")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Always download pages instead of using {http_cache.CACHE_DIR}/")
+    xlsx_writers.add_engine_argument(parser)
+
+def apply_fetch_arguments(args):
+    """Configure the shared response cache, HTML parser and workbook writer from parsed command-line arguments"""
+    goodreads_parser.set_parser(args.parser)
+    xlsx_writers.set_engine(args.xlsx_engine)
+    goodreads_parser.set_debug(args.debug or goodreads_parser.DEBUG)
+    http_cache.configure(
+        enabled=not args.no_cache,
+        ttl=args.cache_ttl * 3600,
+        max_bytes=int(args.cache_max_mb * 1024 * 1024)
+    )
+    author_index.configure(refresh=args.refresh_authors)
+
+def fetch_options(args):
+    """Keyword arguments for scrape_names() taken from parsed command-line arguments"""
+    return {
+        "rate": args.rate,
+        "burst": args.burst,
+        "max_in_flight": args.max_in_flight,
+        "max_pages": args.max_pages,
+        "prefetch": args.prefetch,
+        "workers": args.workers,
+    }
+
+def print_cache_stats():
+    cache = http_cache.default_cache()
+    if cache is not None:
+        print(f"🗄️  {cache.stats()}")
+    index = author_index.default_index()
+    if index is not None:
+        print(f"🪪 {index.stats()}")
+
 # Test function for a single author
 def test_single_author(author_name):
     """Test scraping for a single author with detailed output"""
@@ -221,10 +327,18 @@ def test_single_author(author_name):
 
 # Main Runner
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Goodreads backlists for announced authors")
+    add_fetch_arguments(parser)
+    args = parser.parse_args()
+    apply_fetch_arguments(args)
+
     author_df = pd.read_excel("announced_authors.xlsx", engine='openpyxl')
-   
-    all_books = []
+    if "Goodreads Page" in author_df.columns:
+        pinned = author_index.pin_roster_links(author_index.default_index(), author_df.to_dict("records"))
+        if pinned:
+            print(f"📌 Using {pinned} Goodreads links from the roster")
 
+    jobs = []
     for idx, row in author_df.iterrows():
         author_name = row["Author Name"]
         role = row.get("Role", "Author")
@@ -233,29 +347,40 @@ if __name__ == "__main__":
         if pd.isna(author_name):
             continue
             
-        print(f"\n🔍 Scraping {author_name} ({role})...")
+        print(f"\n🔍 Queued {author_name} ({role})...")
         
         # Scrape main name
-        author_url = search_goodreads_author(author_name)
-        if author_url:
-            books = scrape_goodreads_books(author_url, author_name, role, author_name)
-            all_books.extend(books)
-            time.sleep(2)  # Be polite to Goodreads
+        jobs.append((author_name, author_name, role, author_name))
         
         # Scrape pen names if they exist
         if not pd.isna(other_names) and str(other_names).strip():
             pen_names = [name.strip() for name in str(other_names).split(",") if name.strip()]
             for pen_name in pen_names:
                 print(f"  🖋️  Also scraping pen name: {pen_name}")
-                pen_url = search_goodreads_author(pen_name)
-                if pen_url:
-                    pen_books = scrape_goodreads_books(pen_url, author_name, role, pen_name)
-                    all_books.extend(pen_books)
-                    time.sleep(2)
-
-    # Create DataFrame and save
-    df = pd.DataFrame(all_books)
-    df.to_excel("author_backlists_scraped.xlsx", index=False)
+                jobs.append((pen_name, author_name, role, pen_name))
+
+    store = open_store()
+    total_books = 0
+
+    def save_name(job, books, complete, fingerprint):
+        global total_books
+        search_name, author_name, _, pen_name = job
+        if not complete:
+            # Partial lists are not saved; the name stays unfinished for the next run
+            print(f"⚠️  Scrape of {search_name} was incomplete; it will be retried next run")
+            return
+        for book in books:
+            # Same convention as full_pipeline.py: the main name has no pen name
+            book["Pen Name"] = pen_name if pen_name != author_name else ""
+        store.record_name(author_name, search_name, books, fingerprint)
+        total_books += len(books)
+
+    # Requests are spaced out by the per-host token bucket - be polite to Goodreads
+    scrape_names(jobs, **fetch_options(args), on_result=save_name)
+
+    # The store is the system of record; the workbook is an export of it
+    store.export_xlsx(LEGACY_XLSX)
     
-    print(f"\n🎉 Scraping completed! Found {len(all_books)} total books")
-    print("Data saved to author_backlists_scraped.xlsx")
\ No newline at end of file
+    print(f"\n🎉 Scraping completed! Found {total_books} total books")
+    print(f"Data saved to {store.path} and exported to {LEGACY_XLSX}")
+    print_cache_stats()
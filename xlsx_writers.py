@@ -0,0 +1,176 @@
+# xlsx_writers.py (one small workbook-writing interface over openpyxl or xlsxwriter)
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+
+try:
+    import xlsxwriter
+    HAVE_XLSXWRITER = True
+except ImportError:
+    HAVE_XLSXWRITER = False
+
+# "fast" = xlsxwriter in constant-memory mode (when installed); "openpyxl" = openpyxl's write-only mode
+ENGINE_CHOICES = ["fast", "openpyxl"]
+DEFAULT_ENGINE = "fast"
+_engine = DEFAULT_ENGINE
+
+
+def set_engine(name):
+    global _engine
+    if name not in ENGINE_CHOICES:
+        raise ValueError(f"Unknown xlsx engine '{name}' (choose from {', '.join(ENGINE_CHOICES)})")
+    _engine = name
+
+
+def add_engine_argument(parser):
+    parser.add_argument("--xlsx-engine", choices=ENGINE_CHOICES, default=DEFAULT_ENGINE,
+                        help="Workbook writer: 'fast' uses xlsxwriter when installed, "
+                             "otherwise openpyxl (default: %(default)s)")
+
+
+class OpenpyxlWorkbook:
+    """
+    openpyxl in write-only mode: each sheet streams to a temporary file and every cell refers
+    to a named style registered once per workbook.
+    """
+
+    def __init__(self, path, styles):
+        self.path = path
+        self.wb = Workbook(write_only=True)
+        for name, spec in styles.items():
+            self.wb.add_named_style(self._named_style(name, spec))
+
+    @staticmethod
+    def _named_style(name, spec):
+        style = NamedStyle(name)
+        if spec.get("bold") or spec.get("italic") or spec.get("color"):
+            style.font = Font(bold=spec.get("bold"), italic=spec.get("italic"), color=spec.get("color"))
+        else:
+            style.font = DEFAULT_FONT
+        if spec.get("fill"):
+            style.fill = PatternFill(start_color=spec["fill"], end_color=spec["fill"], fill_type="solid")
+        if spec.get("border"):
+            side = Side(style="thin", color="000000")
+            style.border = Border(left=side, right=side, top=side, bottom=side)
+        if spec.get("align"):
+            style.alignment = Alignment(horizontal=spec["align"])
+        if spec.get("number_format"):
+            style.number_format = spec["number_format"]
+        return style
+
+    def add_sheet(self, title):
+        return OpenpyxlSheet(self.wb.create_sheet(title))
+
+    def close(self):
+        self.wb.save(self.path)
+
+
+class OpenpyxlSheet:
+    def __init__(self, ws):
+        self.ws = ws
+        self.rows = 0
+
+    def append(self, values, style=None, span=1):
+        """
+        Write the next row. style is a style name, one per column, or None for unstyled values;
+        span > 1 merges the first cell across that many columns.
+        """
+        self.rows += 1
+        if span > 1:
+            self.ws.merged_cells.add(f"A{self.rows}:{get_column_letter(span)}{self.rows}")
+        if style is None:
+            self.ws.append(values)
+            return
+        styles = [style] * len(values) if isinstance(style, str) else style
+        row = []
+        for value, cell_style in zip(values, styles):
+            cell = WriteOnlyCell(self.ws, value=value)
+            cell.style = cell_style
+            row.append(cell)
+        self.ws.append(row)
+
+
+class XlsxWriterWorkbook:
+    """
+    xlsxwriter with constant_memory: a row is flushed as soon as the next one starts, so
+    memory use doesn't grow with the row count. Rows must be written top to bottom.
+    """
+
+    def __init__(self, path, styles):
+        # Strings stay strings, as with openpyxl: no automatic hyperlinks
+        self.wb = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+        self.formats = {name: self.wb.add_format(self._format(spec)) for name, spec in styles.items()}
+
+    @staticmethod
+    def _format(spec):
+        fmt = {}
+        if spec.get("bold"):
+            fmt["bold"] = True
+        if spec.get("italic"):
+            fmt["italic"] = True
+        if spec.get("color"):
+            fmt["font_color"] = f"#{spec['color']}"
+        if spec.get("fill"):
+            fmt.update(pattern=1, bg_color=f"#{spec['fill']}")
+        if spec.get("border"):
+            fmt.update(border=1, border_color="#000000")
+        if spec.get("align"):
+            fmt["align"] = spec["align"]
+        if spec.get("number_format"):
+            fmt["num_format"] = spec["number_format"]
+        return fmt
+
+    def add_sheet(self, title):
+        return XlsxWriterSheet(self.wb.add_worksheet(title), self.formats)
+
+    def close(self):
+        self.wb.close()
+
+
+class XlsxWriterSheet:
+    def __init__(self, ws, formats):
+        self.ws = ws
+        self.formats = formats
+        self.rows = 0
+
+    def append(self, values, style=None, span=1):
+        row = self.rows
+        self.rows += 1
+        styles = [style] * len(values) if style is None or isinstance(style, str) else style
+        formats = [self.formats[name] if name else None for name in styles]
+        for col, (value, fmt) in enumerate(zip(values, formats)):
+            if col == 0 and span > 1:
+                self.ws.merge_range(row, 0, row, span - 1, value, fmt)
+            elif 0 < col < span:
+                continue
+            elif value is None:
+                if fmt is not None:
+                    self.ws.write_blank(row, col, None, fmt)
+            else:
+                self.ws.write(row, col, value, fmt)
+
+
+def open_workbook(path, styles, engine=None):
+    """
+    A workbook writer for path. styles maps style names to specs with any of: bold, italic,
+    color (font, hex), fill (hex), border (thin, black), align, number_format.
+    """
+    engine = engine or _engine
+    if engine == "fast" and HAVE_XLSXWRITER:
+        return XlsxWriterWorkbook(path, styles)
+    return OpenpyxlWorkbook(path, styles)
+
+
+def write_dataframe(df, path, sheet_name="Sheet1", engine=None):
+    """df.to_excel(path, index=False) through the chosen engine, one row at a time"""
+    wb = open_workbook(path, {}, engine)
+    ws = wb.add_sheet(sheet_name)
+    ws.append([str(column) for column in df.columns])
+    # Missing values become empty cells, as with to_excel
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(list(row))
+    wb.close()